@@ -0,0 +1 @@
+"""Runnable benchmarks and stress checks: python -m benchmarks.<name>"""
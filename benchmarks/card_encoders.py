@@ -0,0 +1,29 @@
+"""Encode time and size of the reminder card for every output profile
+
+    python -m benchmarks.card_encoders --encodes 20
+"""
+import argparse
+
+from benchmarks.page_render import REMINDER_DETAILS, per_call
+from reminder_core.card import QR_SIZE, create_reminder_image
+from reminder_core.card_output import CARD_OUTPUT_PROFILES, encode_card
+from reminder_core.qr import QR_LOGO_PATH, qr_logo_image, qr_matrix
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--encodes', type=int, default=20)
+    args = parser.parse_args()
+
+    matrix = qr_matrix("https://pet-reminder.s3.us-east-1.amazonaws.com/pages/QR0001_Rex_NexGardSPE.html", border=6)
+    card = create_reminder_image('Rex', 'NexGard SPECTRA', REMINDER_DETAILS, qr_logo_image(matrix, QR_LOGO_PATH, size=QR_SIZE))
+
+    print(f"{'profile':<12} {'encode':>10} {'size':>10}")
+    for name in CARD_OUTPUT_PROFILES:
+        seconds = per_call(lambda: encode_card(card, name), args.encodes)
+        size = len(encode_card(card, name))
+        print(f"{name:<12} {seconds * 1e3:7.1f} ms {size / 1024:7.1f} KB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""Cold-start measurement of the app: import time per dependency and time to first render
+
+    python -m benchmarks.cold_start
+    python -m benchmarks.cold_start --repeat 5 --budget-ms 1500
+
+Every number comes from a fresh interpreter. Time to first render is the first
+AppTest run of pet_reminder.py (module imports, S3 and font setup, form render)
+after Streamlit itself is imported. Exits non-zero when it exceeds the budget.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+# Startup budget for the first render of the form, documented in README.md
+COLD_START_BUDGET_MS = 1500
+
+DEPENDENCIES = [
+    'streamlit',
+    'boto3',
+    'PIL.Image',
+    'numpy',
+    'qrcode',
+    'dateutil.relativedelta',
+    'reminder_core.api',
+]
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'pet_reminder.py')
+
+_IMPORT_SNIPPET = '''
+import time
+started = time.perf_counter()
+import {module}
+print((time.perf_counter() - started) * 1000)
+'''
+
+_RENDER_SNIPPET = '''
+import sys, time
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file({path!r}, default_timeout=120)
+started = time.perf_counter()
+app.run()
+elapsed = (time.perf_counter() - started) * 1000
+if app.exception:
+    sys.exit("first render failed: " + str(app.exception[0].value))
+print(elapsed)
+'''
+
+
+def _run(snippet):
+    output = subprocess.run(
+        [sys.executable, '-c', snippet], capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(APP_PATH)
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def import_time(module, repeat):
+    """Best-of-``repeat`` milliseconds to import ``module`` in a fresh interpreter"""
+    return min(_run(_IMPORT_SNIPPET.format(module=module)) for _ in range(repeat))
+
+
+def first_render_time(repeat):
+    """Best-of-``repeat`` milliseconds for the first run of the app in a fresh interpreter"""
+    return min(_run(_RENDER_SNIPPET.format(path=APP_PATH)) for _ in range(repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--budget-ms', type=float, default=COLD_START_BUDGET_MS)
+    args = parser.parse_args()
+
+    for module in DEPENDENCIES:
+        print(f"import {module:<24} {import_time(module, args.repeat):8.1f} ms")
+
+    render = first_render_time(args.repeat)
+    print(f"first render of the form       {render:8.1f} ms (budget {args.budget_ms:.0f} ms)")
+    if render > args.budget_ms:
+        sys.exit(f"first render {render:.0f} ms is over the {args.budget_ms:.0f} ms budget")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+"""Check the direct ICS serializer against the icalendar reference and time both
+
+    python -m benchmarks.ics_serializer --calendars 2000
+
+Every case must produce the same text as the reference (apart from the random
+UIDs and the DTSTAMP) and parse to the same components and property values.
+Exits non-zero on the first mismatch. The reference is the icalendar-based
+implementation the app used before the direct serializer; it needs pytz.
+"""
+import argparse
+import re
+import sys
+import uuid
+from datetime import date, datetime, timedelta
+
+import pytz
+from dateutil.relativedelta import relativedelta
+from icalendar import Alarm, Calendar, Event, vDate
+
+from benchmarks.page_render import per_call
+from reminder_core.calendar_ics import create_calendar_reminder
+
+CASES = [
+    ('Rex', 'NexGard SPECTRA', 12, '08:30', date(2026, 1, 1), 'Give with food'),
+    ('Rex', 'NexGard SPECTRA', 12, '', date(2026, 1, 31), ''),
+    ('Bella', 'NexGard SPECTRA', 24, '23:45', date(2026, 12, 31), ''),
+    ('Ré, "Mimi"; Jr\\', 'NexGard SPECTRA (Large)', 15, '', date(2026, 2, 28), 'line one\nline two, with; stuff\\n'),
+    ('Max', 'NexGard SPECTRA', 12, '07:00', date(2026, 3, 1), 'ünïcødé ' + 'é' * 90 + ' 🐾' * 20),
+    ('A' * 80, 'NexGard SPECTRA', 1, '12:00', date(2026, 8, 31), 'x\\' * 60),
+]
+
+_VOLATILE = re.compile(r'^(UID|DTSTAMP):.*$', re.MULTILINE)
+
+
+def create_calendar_reminder_icalendar(pet_name, product_name, dosage, reminder_time, start_date, notes=""):
+    """Reference implementation built from icalendar objects; the fast serializer is checked against it"""
+    # Calculate reminder count for RRULE
+    reminder_count = dosage
+
+    # Create calendar
+    cal = Calendar()
+    cal.add('prodid', '-//Pet Medication Reminder//Boehringer Ingelheim//EN')
+    cal.add('version', '2.0')
+    cal.add('calscale', 'GREGORIAN')
+    cal.add('method', 'PUBLISH')
+
+    # Create event
+    event = Event()
+    event_title = f"Time to give {pet_name} {product_name}!"
+    event.add('summary', event_title)
+
+    mytz = pytz.timezone('Asia/Singapore')
+
+    if reminder_time == '' or reminder_time is None:
+        # All-day event
+        event.add('description', f"Dosage reminder: {product_name}\nPet: {pet_name}\n{notes}")
+        event.add('dtstart', vDate(start_date))
+        event.add('dtend', vDate(start_date + timedelta(days=1)))
+
+        # Create alarm for 12:00 PM on the event date (12 hours after midnight)
+        alarm = Alarm()
+        alarm.add('action', 'DISPLAY')
+        alarm.add('description', f'Time to give {pet_name} {product_name}')
+
+        # Use relative trigger: 12 hours after the start of the all-day event
+        alarm.add('trigger', timedelta(hours=12))
+        alarm['trigger'].params['RELATED'] = 'START'
+
+    else:
+        # Timed event
+        event.add('description', f"Dosage reminder: {product_name}\nPet: {pet_name}\nTime: {reminder_time}\n{notes}")
+        start_time = datetime.combine(start_date, datetime.strptime(reminder_time, "%H:%M").time())
+
+        # Localize the start time to Singapore timezone
+        start_time = mytz.localize(start_time)
+
+        event.add('dtstart', start_time)
+        event.add('dtend', start_time + timedelta(hours=1))
+
+        # Create alarm for 15 minutes before the event
+        alarm = Alarm()
+        alarm.add('action', 'DISPLAY')
+        alarm.add('description', f'Time to give {pet_name} {product_name}')
+        alarm.add('trigger', timedelta(minutes=-15))
+
+    event.add('dtstamp', datetime.now())
+    event.add('uid', str(uuid.uuid4()))
+
+    # Add recurrence rule with count limit
+    rrule = {}
+    rrule['freq'] = 'monthly'
+
+    if reminder_count > 0:
+        rrule['count'] = reminder_count
+
+    event.add('rrule', rrule)
+
+    # Add the alarm to the event
+    event.add_component(alarm)
+    cal.add_component(event)
+
+    # Refill Event Reminder
+
+    refill_reminder_date = start_date + relativedelta(months=2)
+
+    # Create refill event
+    refill_event = Event()
+    refill_event_title = f"Time to refill {pet_name}'s {product_name}"
+    refill_event.add('summary', refill_event_title)
+
+    refill_description = f"MEDICATION REFILL REMINDER\n\nPet: {pet_name}\nMedication: {product_name}\n\nContinue to keep {pet_name} safe from parasites!"
+
+    if notes:
+        refill_description += f"\n\nNotes: {notes}"
+
+    refill_event.add('description', refill_description)
+
+    if reminder_time == '' or reminder_time is None:
+        # All-day refill reminder
+        refill_event.add('dtstart', vDate(refill_reminder_date))
+        refill_event.add('dtend', vDate(refill_reminder_date + timedelta(days=1)))
+
+        # Create alarm for 10:00 AM on refill reminder date
+        refill_alarm = Alarm()
+        refill_alarm.add('action', 'DISPLAY')
+        refill_alarm.add('description', f'Time to refill {pet_name}\'s {product_name}!')
+        refill_alarm.add('trigger', timedelta(hours=10))
+        refill_alarm['trigger'].params['RELATED'] = 'START'
+
+    else:
+        # Timed refill reminder (use same time as medication reminder)
+        refill_start_time = datetime.combine(refill_reminder_date, datetime.strptime(reminder_time, "%H:%M").time())
+        refill_start_time = mytz.localize(refill_start_time)
+
+        refill_event.add('dtstart', refill_start_time)
+        refill_event.add('dtend', refill_start_time + timedelta(hours=1))
+
+        # Create alarm for 15 minutes before refill reminder
+        refill_alarm = Alarm()
+        refill_alarm.add('action', 'DISPLAY')
+        refill_alarm.add('description', f'Time to refill {pet_name}\'s {product_name}!')
+        refill_alarm.add('trigger', timedelta(minutes=-15))
+
+    refill_event.add('dtstamp', datetime.now())
+    refill_event.add('uid', str(uuid.uuid4()))
+
+    # Add categories to help distinguish the event types
+    refill_event.add('categories', ['MEDICATION', 'REFILL', 'PET_CARE'])
+
+    # Add the refill alarm to the refill event
+    refill_event.add_component(refill_alarm)
+
+    # Add refill event to calendar
+    cal.add_component(refill_event)
+
+    return cal.to_ical().decode('utf-8')
+
+
+def _parsed(text):
+    """(component name, [(property, params, value)]) for every component, minus UID and DTSTAMP"""
+    return [
+        (component.name, [
+            (name, dict(value.params), value.to_ical())
+            for name, value in component.items()
+            if name not in ('UID', 'DTSTAMP')
+        ])
+        for component in Calendar.from_ical(text).walk()
+    ]
+
+
+def validate():
+    for case in CASES:
+        fast = create_calendar_reminder(*case)
+        reference = create_calendar_reminder_icalendar(*case)
+        if _VOLATILE.sub('', fast) != _VOLATILE.sub('', reference):
+            return f"text differs for {case!r}"
+        if _parsed(fast) != _parsed(reference):
+            return f"parsed calendars differ for {case!r}"
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calendars', type=int, default=2000)
+    args = parser.parse_args()
+
+    error = validate()
+    if error:
+        sys.exit(error)
+    print(f"{len(CASES)} cases match the icalendar reference")
+
+    for label, func in (('icalendar objects', create_calendar_reminder_icalendar), ('direct serializer', create_calendar_reminder)):
+        seconds = per_call(lambda: [func(*case) for case in CASES[:2]], args.calendars // 2) / 2
+        print(f"{label:<18} {seconds * 1e6:8.1f} us/calendar {1 / seconds:10.0f} calendars/s")
+
+
+if __name__ == '__main__':
+    main()
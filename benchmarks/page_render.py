@@ -0,0 +1,65 @@
+"""Micro-benchmark of web page rendering
+
+    python -m benchmarks.page_render --pages 2000
+"""
+import argparse
+import io
+import time
+
+import qrcode
+
+from reminder_core.web_page import WEB_PAGE_TEMPLATE, create_web_page_html
+
+REMINDER_DETAILS = {
+    'frequency': 'Monthly',
+    'start_date': '2026-01-01',
+    'duration': '≈ 12 months',
+    'total_reminders': 12,
+    'times': '12:00',
+    'notes': 'Give with food',
+}
+
+STATIC_URLS = {
+    name: f"https://bucket.s3.us-east-1.amazonaws.com/static/{name}.0123456789abcdef"
+    for name in ('stylesheet', 'logo', 'favicon', 'calendar_icon', 'back_icon')
+}
+
+
+def sample_qr_bytes():
+    buffer = io.BytesIO()
+    qrcode.make("https://bucket.s3.us-east-1.amazonaws.com/pages/QR0001_Rex_NexGard.html").save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def per_call(func, count, repeat=5):
+    """Best-of-``repeat`` seconds per call"""
+    func()
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(count):
+            func()
+        best = min(best, (time.perf_counter() - started) / count)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=2000)
+    args = parser.parse_args()
+
+    qr_bytes = sample_qr_bytes()
+    calendar_url = "https://bucket.s3.us-east-1.amazonaws.com/calendars/QR0001_Rex_NexGard.ics"
+
+    inline = per_call(lambda: create_web_page_html('Rex', 'NexGard SPECTRA', calendar_url, REMINDER_DETAILS, qr_bytes), args.pages)
+    shared = per_call(lambda: create_web_page_html('Rex', 'NexGard SPECTRA', calendar_url, REMINDER_DETAILS, qr_bytes, STATIC_URLS), args.pages)
+    slots = {name: 'x' for name in WEB_PAGE_TEMPLATE.names}
+    template_only = per_call(lambda: WEB_PAGE_TEMPLATE.render(**slots), args.pages)
+
+    print(f"create_web_page_html (inline assets): {inline * 1e6:8.1f} us/page")
+    print(f"create_web_page_html (shared assets): {shared * 1e6:8.1f} us/page")
+    print(f"template render only:                 {template_only * 1e6:8.1f} us/page")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""End-to-end generate_bundle cost per storage backend
+
+    python -m benchmarks.pipeline --bundles 30 --latency 0.03
+
+``memory`` has no I/O at all, so its time is the pure compute cost of a
+bundle (rendering, encoding, dedup and sequence bookkeeping). ``memory+latency``
+adds a simulated round trip to every storage call and ``local`` writes to a
+temporary directory; ``--s3`` adds the configured bucket (AWS_ENDPOINT_URL_S3
+is honoured). The difference to ``memory`` is what storage costs a submit.
+``write-behind`` runs only wait for the page upload and the journal
+(see reminder_core.journal); the journal is drained before the next run.
+"""
+import argparse
+import tempfile
+import time
+import uuid
+from datetime import date
+
+from reminder_core.api import BundleSpec, generate_bundle, warm_up
+from reminder_core.backends import get_storage_backend
+from reminder_core.config import load_config
+from reminder_core.journal import get_upload_journal
+
+
+def run(config, bundles, label):
+    # Unique pets (also across runs against a persistent bucket), so every bundle is rendered, uploaded and indexed
+    run_id = uuid.uuid4().hex[:6]
+    specs = [
+        BundleSpec(f"{label} {run_id} {i}", date(2026, 1, 1), 12, '08:30', 'Give with food')
+        for i in range(bundles + 1)
+    ]
+    generate_bundle(specs[0], config)
+    started = time.perf_counter()
+    for spec in specs[1:]:
+        result = generate_bundle(spec, config)
+        if result.errors or result.warnings:
+            raise RuntimeError(f"{label}: {'; '.join(result.errors + result.warnings)}")
+    return (time.perf_counter() - started) / bundles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bundles', type=int, default=30)
+    parser.add_argument('--latency', type=float, default=0.03, help="Simulated storage round trip in seconds")
+    parser.add_argument('--s3', action='store_true', help="Also run against the configured S3 bucket")
+    args = parser.parse_args()
+
+    warm_up()
+    config = load_config()._replace(write_behind_uploads=False, upload_journal_dir=tempfile.mkdtemp())
+    latency = config._replace(storage_backend='memory', bucket='pipeline-latency')
+    runs = [
+        ('memory', config._replace(storage_backend='memory', bucket='pipeline-compute')),
+        ('memory+latency', latency),
+        ('memory+latency write-behind', latency._replace(write_behind_uploads=True)),
+        ('local', config._replace(storage_backend='local', local_storage_dir=tempfile.mkdtemp(), local_storage_url='')),
+    ]
+    if args.s3:
+        s3 = config._replace(storage_backend='s3')
+        runs += [('s3', s3), ('s3 write-behind', s3._replace(write_behind_uploads=True))]
+    get_storage_backend(latency).latency = args.latency
+
+    compute = None
+    print(f"{'backend':<28} {'per bundle':>12} {'storage':>10}")
+    for label, run_config in runs:
+        seconds = run(run_config, args.bundles, label)
+        if run_config.write_behind_uploads:
+            get_upload_journal(get_storage_backend(run_config), run_config.upload_journal_dir).wait_until_drained()
+        compute = compute or seconds
+        print(f"{label:<28} {seconds * 1e3:9.1f} ms {(seconds - compute) * 1e3:7.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+"""QR code generation throughput with and without the logo tile cache
+
+    python -m benchmarks.qr_render --codes 200
+"""
+import argparse
+
+from benchmarks.page_render import per_call
+from reminder_core.qr import QR_LOGO_PATH, build_logo_tile, generate_qr_code_preserve_aspect, logo_tile_cache, qr_matrix
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--codes', type=int, default=200)
+    args = parser.parse_args()
+
+    url = "https://pet-reminder.s3.us-east-1.amazonaws.com/pages/QR0001_Rex_NexGardSPE.html"
+    qr_size = 12 * len(qr_matrix(url, border=6))
+
+    def uncached():
+        logo_tile_cache.clear()
+        generate_qr_code_preserve_aspect(url, QR_LOGO_PATH)
+
+    cold = per_call(uncached, args.codes)
+    warm = per_call(lambda: generate_qr_code_preserve_aspect(url, QR_LOGO_PATH), args.codes)
+    tile = per_call(lambda: build_logo_tile(QR_LOGO_PATH, qr_size, 8), args.codes)
+
+    print(f"without logo cache: {1 / cold:8.1f} QR/s ({cold * 1e3:.2f} ms each)")
+    print(f"with logo cache:    {1 / warm:8.1f} QR/s ({warm * 1e3:.2f} ms each)")
+    print(f"logo tile build:    {tile * 1e3:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
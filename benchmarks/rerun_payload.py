@@ -0,0 +1,79 @@
+"""Payload and latency of a Streamlit rerun while the user types in the form
+
+    python -m benchmarks.rerun_payload --keystrokes 10
+
+Drives pet_reminder.py with Streamlit's AppTest (in-memory storage, no
+network), typing the pet name one character per rerun, and records every
+ForwardMsg the script sends. ``sent`` is the serialized size of those
+messages; ``with browser cache`` replaces large messages the browser already
+holds from an earlier run by the hash reference Streamlit sends instead
+(see global.minCachedMessageSize). Run it from the repository root so
+.streamlit/config.toml (static serving of the stylesheet) applies; ``--inline``
+measures the inline-CSS fallback instead.
+"""
+import argparse
+import os
+import statistics
+import time
+
+from streamlit import config
+from streamlit.runtime.forward_msg_cache import create_reference_msg
+from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'pet_reminder.py')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--keystrokes', type=int, default=10)
+    parser.add_argument('--inline', action='store_true', help="Inline the stylesheet instead of linking it")
+    args = parser.parse_args()
+    if args.inline:
+        config.set_option('server.enableStaticServing', False)
+
+    recorded = []
+    enqueue = ForwardMsgQueue.enqueue
+
+    def recording_enqueue(queue, msg):
+        recorded.append((msg.ByteSize(), msg.hash, msg.metadata.cacheable, create_reference_msg(msg).ByteSize()))
+        return enqueue(queue, msg)
+
+    ForwardMsgQueue.enqueue = recording_enqueue
+
+    app = AppTest.from_file(APP_PATH, default_timeout=60)
+    app.secrets['STORAGE_BACKEND'] = 'memory'
+    browser_cache = set()
+
+    def run(action):
+        recorded.clear()
+        started = time.perf_counter()
+        action()
+        seconds = time.perf_counter() - started
+        sent = sum(size for size, _, _, _ in recorded)
+        cached = sum(
+            ref_size if cacheable and msg_hash in browser_cache else size
+            for size, msg_hash, cacheable, ref_size in recorded
+        )
+        browser_cache.update(msg_hash for _, msg_hash, cacheable, _ in recorded if cacheable)
+        return seconds, sent, cached, len(recorded)
+
+    first = run(app.run)
+    # One more plain run so caches and lazily imported modules are warm
+    run(app.run)
+
+    name = 'Rexington the Third'
+    reruns = [
+        run(lambda i=i: app.text_input(key='pet_name_input').input(name[:i + 1]).run())
+        for i in range(args.keystrokes)
+    ]
+
+    print(f"first render:  {first[0] * 1e3:7.1f} ms  {first[1] / 1024:6.1f} KB sent in {first[3]} messages")
+    print(f"per keystroke: {statistics.median(r[0] for r in reruns) * 1e3:7.1f} ms  "
+          f"{statistics.median(r[1] for r in reruns) / 1024:6.1f} KB sent, "
+          f"{statistics.median(r[2] for r in reruns) / 1024:6.1f} KB with browser cache "
+          f"({reruns[0][3]} messages)")
+
+
+if __name__ == '__main__':
+    main()
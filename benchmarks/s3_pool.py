@@ -0,0 +1,62 @@
+"""Throughput of parallel put_object calls as the client's connection pool grows
+
+    python -m benchmarks.s3_pool --endpoint-url http://127.0.0.1:5000 --bucket pet-reminder
+
+Every pool size gets its own shared client from reminder_core.storage (with
+the configured timeouts and retries), and ``--threads`` threads PUT card-sized
+objects through it, like that many sessions uploading at once. Threads beyond
+the pool size wait for a free connection. Without ``--endpoint-url`` the
+client talks to AWS_ENDPOINT_URL_S3 or real S3, so point it at a test bucket.
+"""
+import argparse
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from reminder_core.config import load_config
+from reminder_core.storage import get_s3_client
+
+
+def run(client, bucket, threads, puts, body):
+    prefix = f"benchmarks/s3_pool/{uuid.uuid4().hex}/"
+
+    def put(i):
+        client.put_object(Bucket=bucket, Key=f"{prefix}{i}.bin", Body=body, ContentType='application/octet-stream')
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        # Warm the pool first so connection setup is not counted
+        list(executor.map(put, range(threads)))
+        started = time.perf_counter()
+        list(executor.map(put, range(puts)))
+        return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--endpoint-url', help="S3-compatible endpoint, e.g. a local moto server")
+    parser.add_argument('--bucket', help="Defaults to S3_BUCKET_NAME")
+    parser.add_argument('--threads', type=int, default=32, help="Concurrent uploaders")
+    parser.add_argument('--puts', type=int, default=400, help="Objects per pool size")
+    parser.add_argument('--size', type=int, default=45 * 1024, help="Object size in bytes")
+    parser.add_argument('--pools', default='1,2,4,8,16,32', help="Comma-separated pool sizes")
+    args = parser.parse_args()
+
+    if args.endpoint_url:
+        # Picked up by boto3 when the client is built
+        os.environ['AWS_ENDPOINT_URL_S3'] = args.endpoint_url
+    config = load_config()
+    bucket = args.bucket or config.bucket
+    body = os.urandom(args.size)
+
+    print(f"{args.threads} threads, {args.puts} PUTs of {args.size / 1024:.0f} KB per pool size")
+    print(f"{'pool':>6} {'PUT/s':>10} {'MB/s':>8}")
+    for pool in (int(value) for value in args.pools.split(',')):
+        transport = config.s3_transport._replace(max_pool_connections=pool)
+        client = get_s3_client(config.region, config.aws_access_key_id, config.aws_secret_access_key, transport)
+        seconds = run(client, bucket, args.threads, args.puts, body)
+        print(f"{pool:>6} {args.puts / seconds:10.1f} {args.puts * args.size / seconds / 1e6:8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Concurrency stress check for the sequence allocator
+
+Simulates several app processes (one allocator each) sharing one counter
+object on an in-memory storage backend, with many sessions per process allocating at
+once. Fails if any number is handed out twice.
+
+    python -m benchmarks.sequence_stress --processes 8 --sessions 16 --per-session 100
+"""
+import argparse
+import sys
+import threading
+import time
+from collections import Counter
+
+from reminder_core.backends import MemoryBackend
+from reminder_core.sequence import COUNTER_KEY, SequenceAllocator
+
+
+def run(processes, sessions, per_session, block_size, latency):
+    storage = MemoryBackend('stress-bucket', latency=latency)
+    allocators = [SequenceAllocator(storage, block_size=block_size) for _ in range(processes)]
+    issued = []
+    errors = []
+    issued_lock = threading.Lock()
+    start_gate = threading.Barrier(processes * sessions)
+
+    def session(allocator):
+        numbers = []
+        start_gate.wait()
+        try:
+            for _ in range(per_session):
+                numbers.append(allocator.next())
+        except Exception as e:
+            errors.append(e)
+        with issued_lock:
+            issued.extend(numbers)
+
+    threads = [
+        threading.Thread(target=session, args=(allocator,))
+        for allocator in allocators
+        for _ in range(sessions)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    duplicates = [n for n, count in Counter(issued).items() if count > 1]
+    counter_value = int(storage.objects[COUNTER_KEY].body)
+    return {
+        'allocations': len(issued),
+        'duplicates': len(duplicates),
+        'errors': errors,
+        'elapsed': elapsed,
+        'rate': len(issued) / elapsed,
+        'counter': counter_value,
+        'gets': storage.calls.get('get', 0),
+        'puts': storage.calls.get('put', 0),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--processes', type=int, default=8)
+    parser.add_argument('--sessions', type=int, default=16)
+    parser.add_argument('--per-session', type=int, default=100)
+    parser.add_argument('--block-size', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.005, help='simulated S3 round trip in seconds')
+    parser.add_argument('--min-rate', type=float, default=200, help='fail below this many allocations/sec')
+    args = parser.parse_args()
+
+    result = run(args.processes, args.sessions, args.per_session, args.block_size, args.latency)
+    print(f"allocations: {result['allocations']}  duplicates: {result['duplicates']}")
+    print(f"elapsed: {result['elapsed']:.2f}s  rate: {result['rate']:.0f}/s")
+    print(f"storage calls: {result['gets']} GET, {result['puts']} PUT  counter: {result['counter']}")
+
+    if result['errors']:
+        sys.exit(f"FAIL: {len(result['errors'])} sessions could not allocate: {result['errors'][0]}")
+    if result['duplicates']:
+        sys.exit("FAIL: duplicate sequence numbers issued")
+    if result['rate'] < args.min_rate:
+        sys.exit(f"FAIL: {result['rate']:.0f} allocations/s is below {args.min_rate:.0f}/s")
+    print("OK")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Memory retained by generated content across many sessions
+
+    python -m benchmarks.session_memory --sessions 200 --cap-mb 4
+
+Generates one bundle per simulated session (local storage backend in a
+temporary directory, so stored objects do not count) and measures with
+tracemalloc what the sessions keep alive: first with every artifact in the
+session dict, as the app used to, then with light references plus the
+shared, size-capped artifact store. Finally every session reads its card back,
+newest first, re-fetching whatever the store has evicted.
+"""
+import argparse
+import gc
+import tempfile
+import tracemalloc
+from datetime import date
+
+from reminder_core.api import BUNDLE_ARTIFACTS, BundleSpec, generate_bundle, load_artifact, remember_artifacts, warm_up
+from reminder_core.artifacts import artifact_store
+from reminder_core.config import load_config
+
+
+def retained(build, sessions):
+    gc.collect()
+    baseline = tracemalloc.get_traced_memory()[0]
+    kept = [build(i) for i in range(sessions)]
+    gc.collect()
+    return kept, tracemalloc.get_traced_memory()[0] - baseline
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, default=200)
+    parser.add_argument('--cap-mb', type=float, default=4, help="Artifact store size cap")
+    args = parser.parse_args()
+
+    warm_up()
+    config = load_config()._replace(
+        storage_backend='local', local_storage_dir=tempfile.mkdtemp(), local_storage_url='',
+        write_behind_uploads=False, content_addressed_bundles=False
+    )
+    artifact_store.max_bytes = int(args.cap_mb * 1024 * 1024)
+    # Render once so fonts, caches and clients are not counted
+    generate_bundle(BundleSpec('Warm', date(2026, 1, 1), 12), config)
+    tracemalloc.start()
+
+    def full_session(i):
+        result = generate_bundle(BundleSpec(f"Full {i}", date(2026, 1, 1), 12, '08:30'), config)
+        return {**result._asdict(), 'pet_name': f"Full {i}"}
+
+    def light_session(i):
+        result = generate_bundle(BundleSpec(f"Light {i}", date(2026, 1, 1), 12, '08:30'), config)
+        return {**remember_artifacts(result), 'pet_name': f"Light {i}"}
+
+    full, full_bytes = retained(full_session, args.sessions)
+    artifact_bytes = sum(len(s[name]) for s in full for name in BUNDLE_ARTIFACTS)
+    del full
+    light, light_bytes = retained(light_session, args.sessions)
+    tracemalloc.stop()
+
+    print(f"{args.sessions} sessions")
+    print(f"artifacts in session state: {full_bytes / 2**20:7.1f} MB retained ({artifact_bytes / 2**20:.1f} MB of artifacts)")
+    print(f"references + shared store:  {light_bytes / 2**20:7.1f} MB retained "
+          f"(store {artifact_store.size / 2**20:.1f} MB, cap {args.cap_mb} MB, {artifact_store.evictions} evicted)")
+
+    # Most recent sessions first, as they are the likeliest to come back
+    cards = [load_artifact(config, session, 'reminder_image_bytes') for session in reversed(light)]
+    print(f"cards read back: {sum(card is not None for card in cards)}/{len(cards)} "
+          f"({artifact_store.hits} from the store, {artifact_store.misses} re-fetched)")
+
+
+if __name__ == '__main__':
+    main()
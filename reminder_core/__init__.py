@@ -0,0 +1 @@
+"""Shared, process-wide building blocks for the pet reminder app"""
@@ -0,0 +1,354 @@
+"""Headless reminder generation API
+
+    from reminder_core.api import BundleSpec, generate_bundle
+
+    result = generate_bundle(BundleSpec('Rex', date(2026, 1, 1), 12, '08:30'))
+    result.web_page_url, result.reminder_image_bytes
+
+Importing this module has no UI or network side effects and loads no heavy
+dependency: the S3 client is built by the background readiness probe and the
+rendering libraries are imported on the first render (or by warm_up()).
+``STORAGE_BACKEND=local`` or ``memory`` runs the whole pipeline offline.
+
+Problems that the app only reports (S3 unavailable, indexing failures) are
+returned in ``warnings`` and ``errors`` instead of being raised.
+"""
+import importlib
+import threading
+from collections import namedtuple
+
+from reminder_core.artifacts import artifact_store
+from reminder_core.backends import get_storage_backend
+from reminder_core.bundle import build_reminder_details, format_meaningful_id, render_bundle
+from reminder_core.config import load_config
+from reminder_core.dedup import bundle_fingerprint, lookup_bundle, record_bundle
+from reminder_core.household import append_to_household, household_slug, is_household_id, issue_household_id
+from reminder_core.journal import get_upload_journal
+from reminder_core.routing import routed_config
+from reminder_core.sequence import get_local_sequence_allocator, get_sequence_allocator
+from reminder_core.static_assets import publish_static_assets
+from reminder_core.storage import AWS_READINESS_WAIT
+from reminder_core.uploads import UploadResult, upload_bundle
+from reminder_core.web_page import web_page_static_assets
+
+DEFAULT_PRODUCT_NAME = "NexGard SPECTRA"
+
+BundleSpec = namedtuple(
+    'BundleSpec',
+    ['pet_name', 'start_date', 'dosage', 'reminder_time', 'notes', 'product_name', 'household', 'market'],
+    defaults=('', '', DEFAULT_PRODUCT_NAME, '', '')
+)
+
+# Heavy BundleResult fields that live in the shared artifact store instead of session state
+BUNDLE_ARTIFACTS = ('reminder_image_bytes', 'qr_image_bytes', 'calendar_data', 'html_content')
+
+BundleResult = namedtuple('BundleResult', [
+    'meaningful_id', 'reminder_details', 'calendar_data', 'qr_image_bytes', 'html_content',
+    'reminder_image_bytes', 'calendar_url', 'web_page_url', 'reminder_image_url', 'household_url',
+    'household_id', 'deduplicated', 'warnings', 'errors'
+])
+
+
+def connect(config):
+    """Shared storage backend for ``config`` (created once per process)
+
+    For S3 the readiness probe, and the client it builds, run in the background;
+    this call never waits on them.
+    """
+    backend = get_storage_backend(config)
+    # Non-blocking: serves the cached state and re-probes in the background once stale
+    backend.refresh()
+    # Resumes uploads journaled by an earlier process
+    upload_journal(backend, config)
+    return backend
+
+
+def upload_journal(backend, config):
+    """The backend's write-behind journal, or None when it is off or its directory is unusable
+
+    Without a journal every object is uploaded during the submit.
+    """
+    if not config.write_behind_uploads:
+        return None
+    try:
+        return get_upload_journal(backend, config.upload_journal_dir)
+    except OSError:
+        return None
+
+
+def storage_backend(config, wait=AWS_READINESS_WAIT):
+    """Storage backend when it is usable, waiting for the first probe; otherwise None"""
+    backend = connect(config)
+    return backend if backend.is_configured(wait=wait) else None
+
+
+_warm_up_started = False
+_warm_up_lock = threading.Lock()
+
+
+def warm_up():
+    """Import the rendering stack and build the card fonts and background on a daemon thread
+
+    Runs once per process, so the first submit does not pay for it.
+    """
+    global _warm_up_started
+    with _warm_up_lock:
+        if _warm_up_started:
+            return
+        _warm_up_started = True
+
+    def _run():
+        importlib.import_module('reminder_core.calendar_ics')
+        importlib.import_module('reminder_core.qr')
+        from reminder_core.card import get_card_background
+        from reminder_core.fonts import warm_up_fonts
+
+        warm_up_fonts()
+        get_card_background()
+
+    threading.Thread(target=_run, name="render-warm-up", daemon=True).start()
+
+
+def next_sequence_number(backend):
+    """Next number from the process-wide allocator (storage-backed when available)
+
+    Raises when storage is available but the lease fails: a number from the
+    in-memory counter could repeat one already stored, and the bundle would
+    overwrite another customer's page, calendar and card.
+    """
+    if backend is None:
+        # Fallback to a process-wide in-memory counter if storage is not available
+        return get_local_sequence_allocator().next()
+
+    # Served from a block leased off system/counter.txt; storage is only hit when it runs out
+    return get_sequence_allocator(backend).next()
+
+
+def remember_artifacts(result):
+    """Keep a result's heavy artifacts in the shared artifact store and return a light reference
+
+    The reference (ID, URLs and the small details dict) is what sessions keep;
+    the artifacts come back through load_artifact.
+    """
+    for name in BUNDLE_ARTIFACTS:
+        artifact_store.put(result.meaningful_id, name, getattr(result, name))
+    return {
+        field: value for field, value in result._asdict().items()
+        if field not in BUNDLE_ARTIFACTS and field not in ('warnings', 'errors')
+    }
+
+
+def _fetch_object(config, url, text=False):
+    if not url:
+        return None
+    backend = storage_backend(config, wait=0)
+    prefix = backend.url('') if backend is not None else None
+    if not prefix or not url.startswith(prefix):
+        return None
+    stored = backend.get(url[len(prefix):].lstrip('/'))
+    if stored is None:
+        return None
+    return stored.body.decode('utf-8') if text else stored.body
+
+
+def _render_qr(url):
+    from reminder_core.qr import QR_LOGO_PATH, encode_png, qr_logo_image, qr_matrix
+
+    # Same QR code render_bundle embeds in the page
+    return encode_png(qr_logo_image(qr_matrix(url, border=6), QR_LOGO_PATH)) if url else None
+
+
+def load_artifact(config, reference, name):
+    """Return an artifact of a referenced bundle, re-fetching it after eviction (None when unavailable)
+
+    Calendar, page and card are read back from storage; the QR code is re-rendered from the page URL.
+    """
+    fetchers = {
+        'calendar_data': lambda: _fetch_object(config, reference.get('calendar_url'), text=True),
+        'html_content': lambda: _fetch_object(config, reference.get('web_page_url'), text=True),
+        'reminder_image_bytes': lambda: _fetch_object(config, reference.get('reminder_image_url')),
+        'qr_image_bytes': lambda: _render_qr(reference.get('web_page_url')),
+    }
+    return artifact_store.get(reference['meaningful_id'], name, fetchers[name])
+
+
+def store_bundle(backend, config, upload_items):
+    """Upload a bundle's items and return {name: UploadResult}
+
+    In write-behind mode only the web page is uploaded here; everything else is
+    journaled and reported as stored once it is safely on local disk.
+    """
+    journal = upload_journal(backend, config)
+    if journal is None:
+        return upload_bundle(backend, upload_items)
+
+    now = [item for item in upload_items if item.name == 'web_page']
+    later = [item for item in upload_items if item.name != 'web_page']
+    results = upload_bundle(backend, now)
+    try:
+        urls = journal.enqueue(later)
+    except OSError:
+        # Journal not writable - fall back to uploading everything now
+        return {**results, **upload_bundle(backend, later)}
+    for item in later:
+        results[item.name] = UploadResult(item.name, item.key, urls[item.name], None)
+    return results
+
+
+def generate_bundle(spec, config=None, meaningful_id=None):
+    """Generate, upload and index the reminder bundle for ``spec``
+
+    Args:
+        spec: BundleSpec with the reminder details
+        config: ReminderConfig, loaded from the environment when omitted
+        meaningful_id: Pre-allocated ID (batch jobs), otherwise one is allocated here
+    """
+    warnings = []
+    if config is None:
+        config = load_config()
+        warnings += config.warnings
+    errors = []
+
+    # Everything below talks to the bucket nearest to the spec's market (or the deployment's)
+    try:
+        config = routed_config(config, spec.market)
+    except ValueError as e:
+        warnings.append(f"{e}; using the default bucket")
+        config = config._replace(storage_routes='', market='')
+
+    reminder_details = build_reminder_details(spec.start_date, spec.dosage, spec.reminder_time, spec.notes)
+    # The name (or ID) as entered; the feed's ID is only issued once the bundle is stored
+    household = household_slug(spec.household)
+    backend = storage_backend(config)
+
+    # Identical details map to the bundle generated earlier: one lookup, no new ID, rendering or uploads.
+    # A household name starts a new private household every time, so only issued IDs (or no household) match
+    fingerprint = None
+    reusable = not household or is_household_id(spec.household)
+    if backend is not None and config.content_addressed_bundles and reusable:
+        fingerprint = bundle_fingerprint(
+            spec.pet_name, spec.product_name, spec.start_date, spec.dosage, spec.reminder_time, spec.notes,
+            household
+        )
+        try:
+            existing = lookup_bundle(backend, fingerprint)
+        except Exception:
+            existing = None
+
+        if existing:
+            return BundleResult(
+                meaningful_id=existing['meaningful_id'],
+                reminder_details=reminder_details,
+                calendar_data=None,
+                qr_image_bytes=None,
+                html_content=None,
+                reminder_image_bytes=None,
+                calendar_url=existing['calendar_url'],
+                web_page_url=existing['web_page_url'],
+                reminder_image_url=existing['reminder_image_url'],
+                household_url=existing.get('household_url'),
+                household_id=existing.get('household_id'),
+                deduplicated=True,
+                warnings=warnings,
+                errors=errors
+            )
+
+    if meaningful_id is None:
+        try:
+            sequence_number = next_sequence_number(backend)
+        except Exception as e:
+            errors.append(f"Could not allocate a reminder ID, please try again: {e}")
+            return BundleResult(
+                meaningful_id=None,
+                reminder_details=reminder_details,
+                calendar_data=None,
+                qr_image_bytes=None,
+                html_content=None,
+                reminder_image_bytes=None,
+                calendar_url=None,
+                web_page_url=None,
+                reminder_image_url=None,
+                household_url=None,
+                household_id=None,
+                deduplicated=False,
+                warnings=warnings,
+                errors=errors
+            )
+        meaningful_id = format_meaningful_id(sequence_number, spec.pet_name, spec.product_name)
+
+    static_urls = None
+    if backend is not None and config.shared_static_assets:
+        try:
+            # Published once per process; later pages only reference the hashed URLs
+            static_urls = publish_static_assets(backend, web_page_static_assets())
+        except Exception as e:
+            warnings.append(f"Could not publish shared page assets, inlining them instead: {e}")
+
+    if backend is None:
+        warnings.append("⚠️ S3 not configured. Calendar file will be available for download only.")
+
+    # Everything is rendered first with its final URLs and uploaded together at the end
+    bundle = render_bundle(
+        meaningful_id, spec.pet_name, spec.product_name, spec.start_date, spec.dosage,
+        spec.reminder_time, spec.notes,
+        backend=backend, static_urls=static_urls,
+        card_profile=config.card_output_profile
+    )
+    calendar_url = bundle.calendar_url
+    web_page_url = bundle.web_page_url
+
+    # Upload calendar, page and image concurrently, or just the page in write-behind mode (optional)
+    reminder_image_url = None
+    household_url = None
+    household_id = None
+    if backend is not None:
+        uploads = store_bundle(backend, config, bundle.upload_items)
+        for result in uploads.values():
+            if not result.ok:
+                errors.append(f"Error uploading {result.key} to S3: {result.error}")
+        calendar_url = uploads['calendar'].url
+        web_page_url = uploads['web_page'].url
+        reminder_image_url = uploads['reminder_image'].url
+
+        uploaded = all(result.ok for result in uploads.values())
+
+        # The pet's events join the household's subscribed feed
+        if household and uploaded:
+            try:
+                household_id = issue_household_id(spec.household)
+                household_url = append_to_household(backend, household_id, bundle.calendar_data, spec.household)
+            except Exception as e:
+                warnings.append(f"Could not add reminder to the household calendar: {e}")
+
+        # Only complete bundles become reusable
+        if fingerprint and uploaded and (household_url or not household):
+            # Deferred with the card and calendar in write-behind mode; a repeat submit before the
+            # journal drains may get URLs whose objects are still on their way
+            index = upload_journal(backend, config) or backend
+            try:
+                record_bundle(index, fingerprint, meaningful_id, {
+                    'calendar_url': calendar_url,
+                    'web_page_url': web_page_url,
+                    'reminder_image_url': reminder_image_url,
+                    'household_url': household_url,
+                    'household_id': household_id
+                })
+            except Exception as e:
+                warnings.append(f"Could not index reminder for reuse: {e}")
+
+    return BundleResult(
+        meaningful_id=meaningful_id,
+        reminder_details=reminder_details,
+        calendar_data=bundle.calendar_data,
+        qr_image_bytes=bundle.qr_image_bytes,
+        html_content=bundle.html_content,
+        reminder_image_bytes=bundle.reminder_image_bytes,
+        calendar_url=calendar_url,
+        web_page_url=web_page_url,
+        reminder_image_url=reminder_image_url,
+        household_url=household_url,
+        household_id=household_id,
+        deduplicated=False,
+        warnings=warnings,
+        errors=errors
+    )
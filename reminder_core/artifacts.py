@@ -0,0 +1,99 @@
+"""Process-wide store for the heavy artifacts of generated bundles
+
+Session state only keeps a bundle's ID and URLs. The card, QR code, calendar
+and page are kept here, shared by every session and bounded in total size:
+entries expire after ``ARTIFACT_STORE_TTL`` seconds and the least recently
+used ones are evicted beyond ``ARTIFACT_STORE_MAX_BYTES``. A miss is filled
+again from a fetch function (storage or a re-render), see
+reminder_core.api.load_artifact.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+# Total bytes kept across all sessions of the process
+ARTIFACT_STORE_MAX_BYTES = 64 * 1024 * 1024
+
+# Seconds an artifact is kept after it was last used
+ARTIFACT_STORE_TTL = 15 * 60
+
+
+def _size(data):
+    return len(data.encode('utf-8')) if isinstance(data, str) else len(data)
+
+
+class ArtifactStore:
+    """Thread-safe LRU of artifacts keyed by (bundle ID, artifact name), with a TTL and a byte cap"""
+
+    def __init__(self, max_bytes=ARTIFACT_STORE_MAX_BYTES, ttl=ARTIFACT_STORE_TTL):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, bundle_id, name, data):
+        """Store an artifact (None is ignored); oversized artifacts are not kept"""
+        if data is None:
+            return
+        size = _size(data)
+        key = (bundle_id, name)
+        with self._lock:
+            self._discard(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (data, size, time.monotonic())
+            self.size += size
+            self._evict()
+
+    def get(self, bundle_id, name, fetch=None):
+        """Return an artifact, calling ``fetch()`` to reload it after a miss (None when unavailable)"""
+        key = (bundle_id, name)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[2] < self.ttl:
+                # Using an artifact keeps it alive
+                self._entries[key] = (entry[0], entry[1], now)
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self._discard(key)
+            self.misses += 1
+            self._evict()
+
+        data = fetch() if fetch is not None else None
+        self.put(bundle_id, name, data)
+        return data
+
+    def discard_bundle(self, bundle_id):
+        """Drop every artifact of a bundle"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == bundle_id]:
+                self._discard(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[1]
+
+    def _evict(self):
+        now = time.monotonic()
+        # Least recently used first, which is also the order they expire in
+        while self._entries:
+            key, (data, size, used_at) = next(iter(self._entries.items()))
+            if self.size <= self.max_bytes and now - used_at < self.ttl:
+                break
+            self._discard(key)
+            self.evictions += 1
+
+
+artifact_store = ArtifactStore()
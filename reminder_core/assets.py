@@ -0,0 +1,101 @@
+"""Process-wide cache of files inlined into HTML as base64 data URLs
+
+Entries are keyed by path and revalidated against the file's mtime and size
+on every lookup, so an edited asset is picked up without a restart. Total
+cached text is bounded and the least recently used entries are evicted
+first.
+"""
+import base64
+import mimetypes
+import os
+import threading
+from collections import OrderedDict
+
+ASSET_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+
+class AssetCache:
+    """LRU cache of data URLs and ``<img>`` snippets for files on disk"""
+
+    def __init__(self, max_bytes=ASSET_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def data_url(self, path, mime_type=None):
+        """Return the file as a ``data:`` URL, or None if it cannot be read"""
+        stamp = self._stamp(path)
+        if stamp is None:
+            return None
+
+        cached = self._get(('data_url', path), stamp)
+        if cached is not None:
+            return cached
+
+        try:
+            with open(path, "rb") as f:
+                encoded = base64.b64encode(f.read()).decode()
+        except OSError:
+            return None
+        mime_type = mime_type or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        return self._put(('data_url', path), stamp, f"data:{mime_type};base64,{encoded}")
+
+    def img_tag(self, path, alt_text, style):
+        """Return a ready-made ``<img>`` tag inlining the file, or None if it cannot be read"""
+        stamp = self._stamp(path)
+        if stamp is None:
+            return None
+
+        key = ('img', path, alt_text, style)
+        cached = self._get(key, stamp)
+        if cached is not None:
+            return cached
+
+        src = self.data_url(path)
+        if src is None:
+            return None
+        return self._put(key, stamp, f'<img src="{src}" alt="{alt_text}" style="{style}">')
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    @staticmethod
+    def _stamp(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _get(self, key, stamp):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != stamp:
+                # File changed on disk since it was cached
+                self._size -= len(entry[1])
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def _put(self, key, stamp, value):
+        if len(value) > self.max_bytes:
+            return value
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous[1])
+            self._entries[key] = (stamp, value)
+            self._size += len(value)
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+        return value
+
+
+asset_cache = AssetCache()
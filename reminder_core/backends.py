@@ -0,0 +1,299 @@
+"""Where reminder bundles, counters and indexes are stored
+
+Every piece of the pipeline reads and writes objects through a
+StorageBackend, so the same code runs against S3, a local directory or
+process memory:
+
+``s3``      the bucket of the (routed) config; the default
+``local``   files under ``LOCAL_STORAGE_DIR/{bucket}/``, served from ``LOCAL_STORAGE_URL`` when set
+``memory``  a dict per bucket that lives as long as the process; nothing leaves it
+
+Select one with ``STORAGE_BACKEND``. The local and memory backends take the
+network out of the pipeline, so benchmarks run offline and measure rendering
+cost alone (``MemoryBackend(latency=...)`` adds it back in a controlled way).
+Object URLs come from the backend too.
+"""
+import contextlib
+import hashlib
+import os
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: conditional writes are only atomic within the process
+    fcntl = None
+
+from reminder_core.storage import get_s3_readiness
+
+STORAGE_BACKENDS = ('s3', 'local', 'memory')
+
+StoredObject = namedtuple('StoredObject', ['body', 'etag'])
+
+_MISSING_CODES = {'NoSuchKey', '404'}
+_CONFLICT_CODES = {'PreconditionFailed', 'ConditionalRequestConflict', '412', '409'}
+
+
+class PreconditionFailed(Exception):
+    """A conditional write lost: the object exists (if_none_match) or changed (if_match)"""
+
+
+def _etag(body):
+    return f'"{hashlib.md5(body).hexdigest()}"'
+
+
+class StorageBackend:
+    """Object store interface used by the whole pipeline
+
+    Keys are S3-style paths (``pages/QR0001_Rex.html``). ``put`` supports the
+    two conditions the pipeline relies on for lock-free updates: create-only
+    (``if_none_match``) and compare-and-swap on an ETag (``if_match``).
+    """
+
+    def get(self, key):
+        """Return the object as a StoredObject, or None when it does not exist"""
+        raise NotImplementedError
+
+    def put(self, key, body, content_type, cache_control=None, content_disposition=None,
+            if_match=None, if_none_match=False):
+        """Store an object and return its ETag, raising PreconditionFailed when a condition fails"""
+        raise NotImplementedError
+
+    def url(self, key):
+        """URL under which the object is served"""
+        raise NotImplementedError
+
+    def refresh(self):
+        """Start a background readiness check if the backend has one"""
+
+    def is_configured(self, wait=0):
+        """Whether the backend can be used, waiting up to ``wait`` seconds for a first check"""
+        return True
+
+    @property
+    def error(self):
+        """Exception of the most recent failed readiness check, if any"""
+        return None
+
+
+def object_url(bucket, region, key):
+    """Public URL of an object in an S3 bucket"""
+    return f"https://{bucket}.s3.{region}.amazonaws.com/{key}"
+
+
+class S3Backend(StorageBackend):
+    """Objects in an S3 bucket, through the shared per-region client and its readiness probe"""
+
+    def __init__(self, readiness, bucket, region):
+        self.readiness = readiness
+        self.bucket = bucket
+        self.region = region
+
+    @property
+    def client(self):
+        """The shared S3 client, built (and boto3 imported) on first access"""
+        return self.readiness.client
+
+    def get(self, key):
+        from botocore.exceptions import ClientError
+
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in _MISSING_CODES:
+                return None
+            raise
+        return StoredObject(response['Body'].read(), response['ETag'])
+
+    def put(self, key, body, content_type, cache_control=None, content_disposition=None,
+            if_match=None, if_none_match=False):
+        from botocore.exceptions import ClientError
+
+        params = {
+            'Bucket': self.bucket,
+            'Key': key,
+            'Body': body,
+            'ContentType': content_type,
+        }
+        if content_disposition:
+            params['ContentDisposition'] = content_disposition
+        if cache_control:
+            params['CacheControl'] = cache_control
+        if if_match:
+            params['IfMatch'] = if_match
+        if if_none_match:
+            params['IfNoneMatch'] = '*'
+        try:
+            return self.client.put_object(**params).get('ETag')
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in _CONFLICT_CODES:
+                raise PreconditionFailed(f"Conditional write of {key} failed") from e
+            raise
+
+    def url(self, key):
+        return object_url(self.bucket, self.region, key)
+
+    def refresh(self):
+        self.readiness.refresh()
+
+    def is_configured(self, wait=0):
+        return self.readiness.is_configured(wait=wait)
+
+    @property
+    def error(self):
+        return self.readiness.error
+
+
+class MemoryBackend(StorageBackend):
+    """Process-memory object store with S3's conditional-write semantics
+
+    ``latency`` adds a sleep to every call, so races between concurrent
+    callers and network cost can be simulated without a network.
+    """
+
+    def __init__(self, bucket='memory', latency=0.0):
+        self.bucket = bucket
+        self.latency = latency
+        self.objects = {}
+        self.calls = {}
+        self._lock = threading.Lock()
+
+    def _call(self, name):
+        with self._lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def get(self, key):
+        self._call('get')
+        with self._lock:
+            return self.objects.get(key)
+
+    def put(self, key, body, content_type, cache_control=None, content_disposition=None,
+            if_match=None, if_none_match=False):
+        self._call('put')
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        stored = StoredObject(body, _etag(body))
+        with self._lock:
+            current = self.objects.get(key)
+            if if_none_match and current is not None:
+                raise PreconditionFailed(f"{key} already exists")
+            if if_match and (current is None or current.etag != if_match):
+                raise PreconditionFailed(f"{key} changed")
+            self.objects[key] = stored
+        return stored.etag
+
+    def url(self, key):
+        return f"memory://{self.bucket}/{key}"
+
+
+class LocalBackend(StorageBackend):
+    """Objects as files under a directory, for offline runs and self-hosted serving
+
+    Conditional writes hold a lock file (where the platform has flock), so batch
+    workers in separate processes can share a directory; writes replace files
+    atomically, so readers never see a partial object.
+    """
+
+    def __init__(self, root, base_url=None):
+        self.root = Path(root)
+        self.base_url = base_url.rstrip('/') + '/' if base_url else None
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        path = self.root.joinpath(*key.split('/')).resolve()
+        root = self.root.resolve()
+        if path != root and root not in path.parents:
+            raise ValueError(f"Key {key!r} escapes the storage directory")
+        return path
+
+    @contextlib.contextmanager
+    def _exclusive(self):
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            self.root.mkdir(parents=True, exist_ok=True)
+            with open(self.root / '.lock', 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                yield
+
+    def get(self, key):
+        try:
+            body = self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+        return StoredObject(body, _etag(body))
+
+    def put(self, key, body, content_type, cache_control=None, content_disposition=None,
+            if_match=None, if_none_match=False):
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temp.write_bytes(body)
+        try:
+            with self._exclusive():
+                if if_none_match or if_match:
+                    current = self.get(key)
+                    if if_none_match and current is not None:
+                        raise PreconditionFailed(f"{key} already exists")
+                    if if_match and (current is None or current.etag != if_match):
+                        raise PreconditionFailed(f"{key} changed")
+                os.replace(temp, path)
+        finally:
+            if temp.exists():
+                temp.unlink()
+        return _etag(body)
+
+    def url(self, key):
+        if self.base_url:
+            return self.base_url + key
+        return self._path(key).as_uri()
+
+    def is_configured(self, wait=0):
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return False
+        return True
+
+
+_backends = {}
+_lock = threading.Lock()
+
+
+def get_storage_backend(config):
+    """Return the process-wide backend for the config's STORAGE_BACKEND, bucket and region"""
+    kind = (config.storage_backend or 's3').lower()
+    if kind not in STORAGE_BACKENDS:
+        raise ValueError(f"Unknown storage backend {kind!r}; expected one of {', '.join(STORAGE_BACKENDS)}")
+
+    if kind == 's3':
+        # The readiness probe (and the client it builds) is shared per bucket and transport
+        readiness = get_s3_readiness(
+            config.bucket, config.region, config.aws_access_key_id, config.aws_secret_access_key,
+            config.s3_transport
+        )
+        key = (kind, readiness)
+    elif kind == 'local':
+        key = (kind, config.local_storage_dir, config.local_storage_url, config.bucket)
+    else:
+        key = (kind, config.bucket)
+
+    with _lock:
+        backend = _backends.get(key)
+        if backend is None:
+            if kind == 's3':
+                backend = S3Backend(readiness, config.bucket, config.region)
+            elif kind == 'local':
+                base_url = f"{config.local_storage_url.rstrip('/')}/{config.bucket}" if config.local_storage_url else None
+                backend = LocalBackend(os.path.join(config.local_storage_dir, config.bucket), base_url)
+            else:
+                backend = MemoryBackend(config.bucket)
+            _backends[key] = backend
+        return backend
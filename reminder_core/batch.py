@@ -0,0 +1,224 @@
+"""Bulk reminder generation for clinic campaigns
+
+Reads a CSV or JSONL file with one pet per row and renders a full bundle for
+each of them with the same code as the Streamlit form. IDs are allocated up
+front in this process; rendering is fanned out over a process pool and every
+worker uploads its bundle concurrently.
+
+With ``--out-dir`` the bundles are written to that directory instead (the
+local storage backend, one subdirectory per bucket with the bucket's key
+layout). IDs then come from a counter kept in the directory and URLs point at
+the written files (or at ``--base-url``), never at the production bucket, so
+later runs into the same directory continue the numbering.
+
+    python -m reminder_core.batch clinic.csv --workers 8
+    python -m reminder_core.batch clinic.jsonl --out-dir ./bundles --base-url https://cdn.example.com/reminders
+
+Columns: pet_name, start_date (YYYY-MM-DD), dosage, time (HH:MM, optional),
+notes (optional), product_name (optional), household (optional), market (optional).
+Rows with the same household name share one new household feed; a household
+ID issued earlier adds the row's pet to that household.
+S3 settings are read by reminder_core.config.load_config from the environment
+unless overridden; rows with a market go to that market's bucket.
+"""
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+
+from reminder_core.api import DEFAULT_PRODUCT_NAME, BundleSpec, generate_bundle
+from reminder_core.backends import get_storage_backend
+from reminder_core.bundle import format_meaningful_id
+from reminder_core.config import load_config
+from reminder_core.household import issue_household_id
+from reminder_core.routing import routed_config
+from reminder_core.sequence import get_sequence_allocator
+
+BatchJob = namedtuple('BatchJob', ['line', 'spec', 'meaningful_id'])
+BatchResult = namedtuple('BatchResult', ['line', 'meaningful_id', 'web_page_url', 'error'])
+
+
+def read_rows(path):
+    """Yield (line number, raw row) for every row: a dict for CSV, the line's JSON text for JSONL"""
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.endswith('.jsonl'):
+            # Decoded by parse_row, so a malformed line is reported as an invalid row
+            for line, text in enumerate(f, start=1):
+                if text.strip():
+                    yield line, text
+        else:
+            # Header is line 1, so data rows start at line 2
+            for line, record in enumerate(csv.DictReader(f), start=2):
+                yield line, record
+
+
+def parse_row(record):
+    """Validate one raw row into a BundleSpec, raising ValueError on bad input"""
+    if isinstance(record, str):
+        record = json.loads(record)
+        if not isinstance(record, dict):
+            raise ValueError("expected a JSON object")
+    pet_name = str(record.get('pet_name') or '').strip()
+    if not pet_name:
+        raise ValueError("pet_name is required")
+
+    start_date = record.get('start_date')
+    if not isinstance(start_date, date):
+        start_date = date.fromisoformat(str(start_date or '').strip())
+
+    dosage = int(record.get('dosage') or 0)
+    if dosage < 1:
+        raise ValueError("dosage must be a positive number")
+
+    reminder_time = str(record.get('time') or '').strip()
+    if reminder_time:
+        # Same HH:MM format as the form's time picker
+        reminder_time = datetime.strptime(reminder_time, "%H:%M").strftime("%H:%M")
+
+    return BundleSpec(
+        pet_name=pet_name,
+        start_date=start_date,
+        dosage=dosage,
+        reminder_time=reminder_time,
+        notes=str(record.get('notes') or ''),
+        product_name=str(record.get('product_name') or DEFAULT_PRODUCT_NAME).strip(),
+        household=str(record.get('household') or '').strip(),
+        market=str(record.get('market') or '').strip()
+    )
+
+
+# Per-worker settings, set once by _init_worker
+_worker = {}
+
+
+def _init_worker(config):
+    _worker.update(config=config)
+
+
+def process_job(job):
+    """Render one bundle and store it; errors are returned, never raised"""
+    config = _worker['config']
+    spec = job.spec
+    try:
+        # Same pipeline as the app; the worker's shared client uploads the bundle's objects concurrently
+        result = generate_bundle(spec, config, meaningful_id=job.meaningful_id)
+        if result.errors or not result.web_page_url or (spec.household and not result.household_url):
+            return BatchResult(job.line, result.meaningful_id, None, "; ".join(result.errors + result.warnings))
+        return BatchResult(job.line, result.meaningful_id, result.web_page_url, None)
+    except Exception as e:
+        return BatchResult(job.line, job.meaningful_id, None, str(e))
+
+
+def report(results, elapsed):
+    """Print failed rows and a summary to stderr and return the exit code"""
+    failures = sorted((result for result in results if result.error), key=lambda result: result.line)
+    for result in failures:
+        print(f"line {result.line}: {result.meaningful_id or '-'}: {result.error}", file=sys.stderr)
+
+    generated = len(results) - len(failures)
+    print(
+        f"{generated} bundles generated, {len(failures)} failed in {elapsed:.1f}s "
+        f"({generated / elapsed if elapsed else 0:.1f} bundles/sec)",
+        file=sys.stderr
+    )
+    return 1 if failures else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('input', help="CSV or JSONL file with one pet per row")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Rendering processes")
+    parser.add_argument('--out-dir', help="Write bundles here instead of uploading them")
+    parser.add_argument('--base-url', help="URL --out-dir will be served from (file:// URLs when omitted)")
+    parser.add_argument('--bucket', help="Overrides S3_BUCKET_NAME")
+    parser.add_argument('--region', help="Overrides AWS_REGION")
+    args = parser.parse_args(argv)
+
+    config = load_config()
+    for message in config.warnings:
+        print(f"warning: {message}", file=sys.stderr)
+    # Workers exit with the run, so uploads are never left to a write-behind journal
+    config = config._replace(
+        bucket=args.bucket or config.bucket, region=args.region or config.region, write_behind_uploads=False
+    )
+    if args.out_dir:
+        # IDs, URLs and objects all come from the directory, so nothing refers to the real bucket
+        config = config._replace(
+            storage_backend='local', local_storage_dir=args.out_dir, local_storage_url=args.base_url or ''
+        )
+
+    results = []
+    jobs = []
+    for line, record in read_rows(args.input):
+        try:
+            jobs.append(BatchJob(line, parse_row(record), None))
+        except Exception as e:
+            results.append(BatchResult(line, None, None, f"invalid row: {e}"))
+
+    # One household ID per name in this run, so its rows share a feed
+    households = {}
+    for index, job in enumerate(jobs):
+        household = job.spec.household
+        if household:
+            if household not in households:
+                households[household] = issue_household_id(household)
+            jobs[index] = job._replace(spec=job.spec._replace(household=households[household]))
+
+    started = time.perf_counter()
+
+    # IDs come from this process only, so workers never contend on the counter.
+    # Each route has its own counter, next to the objects the IDs name
+    allocators = {}
+
+    def allocator_for(spec):
+        backend = get_storage_backend(routed_config(config, spec.market))
+        if backend not in allocators:
+            allocators[backend] = get_sequence_allocator(backend)
+            allocators[backend].block_size = max(allocators[backend].block_size, len(jobs))
+        return allocators[backend]
+
+    allocated = []
+    for index, job in enumerate(jobs):
+        try:
+            allocator = allocator_for(job.spec)
+        except ValueError as e:
+            # Market without a route
+            results.append(BatchResult(job.line, None, None, f"invalid row: {e}"))
+            continue
+        try:
+            number = allocator.next()
+        except Exception as e:
+            # Storage unreachable or misconfigured: nothing can be generated, but report the rows checked so far
+            print(f"Could not allocate reminder IDs from storage: {e}", file=sys.stderr)
+            results += [BatchResult(job.line, None, None, "not generated: no reminder ID") for job in jobs[index:]]
+            report(results, time.perf_counter() - started)
+            return 2
+        allocated.append(job._replace(meaningful_id=format_meaningful_id(number, job.spec.pet_name, job.spec.product_name)))
+    jobs = allocated
+
+    # spawn keeps workers clear of the parent's boto3 sessions and threads
+    with ProcessPoolExecutor(
+        max_workers=args.workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=(config,)
+    ) as executor:
+        chunksize = max(1, len(jobs) // (args.workers * 4))
+        for result in executor.map(process_job, jobs, chunksize=chunksize):
+            results.append(result)
+            if result.error is None:
+                print(f"{result.meaningful_id}\t{result.web_page_url or ''}")
+
+    for household, household_id in households.items():
+        print(f"household {household!r}: {household_id}", file=sys.stderr)
+    return report(results, time.perf_counter() - started)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
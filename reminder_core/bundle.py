@@ -0,0 +1,160 @@
+"""Rendering of one complete reminder bundle: calendar, QR code, web page and card
+
+Shared by the Streamlit form and the batch generator so both produce the same
+artifacts under the same object keys. The renderers pull in PIL, NumPy, qrcode
+and dateutil, so they are imported on the first render instead of here.
+"""
+import math
+from collections import namedtuple
+
+from reminder_core.card_output import DEFAULT_CARD_OUTPUT_PROFILE
+from reminder_core.uploads import UploadItem
+from reminder_core.web_page import create_web_page_html
+
+RenderedBundle = namedtuple('RenderedBundle', [
+    'meaningful_id', 'reminder_details', 'calendar_data', 'qr_image_bytes', 'html_content',
+    'reminder_image_bytes', 'calendar_url', 'web_page_url', 'upload_items'
+])
+
+
+def format_duration_text(start_date, dosage):
+    """Format duration text for display"""
+    total_days = dosage * 30
+
+    if total_days <= 7:
+        return f"{total_days} day{'s' if total_days > 1 else ''}"
+    elif total_days <= 31:
+        weeks = math.ceil(total_days / 7)
+        return f"≈ {weeks} week{'s' if weeks > 1 else ''}"
+    elif total_days <= 365:
+        months = math.ceil(total_days / 30)
+        return f"≈ {months} month{'s' if months > 1 else ''}"
+    else:
+        years = total_days / 365
+        if years >= 2:
+            return f"≈ {years:.1f} years"
+        else:
+            months = math.ceil(total_days / 30)
+            return f"≈ {months} months"
+
+
+def build_reminder_details(start_date, dosage, reminder_time, notes):
+    """Summary shown on the web page and the card"""
+    return {
+        'frequency': 'Monthly',
+        'start_date': start_date.strftime('%Y-%m-%d'),
+        'duration': format_duration_text(start_date, dosage),
+        'total_reminders': dosage,
+        'times': reminder_time,
+        'notes': notes
+    }
+
+
+def format_meaningful_id(sequence_number, pet_name, product_name):
+    """Format: QR0001_PetName_ProductName"""
+    # Clean names for URL (remove special characters, spaces)
+    clean_pet = ''.join(c for c in pet_name if c.isalnum())[:10]
+    clean_product = ''.join(c for c in product_name.split('(')[0] if c.isalnum())[:10]
+    return f"QR{sequence_number:04d}_{clean_pet}_{clean_product}"
+
+
+def calendar_upload_item(calendar_data, file_id):
+    """Describe the calendar file upload"""
+    return UploadItem(
+        name='calendar',
+        key=f"calendars/{file_id}.ics",
+        body=calendar_data.encode('utf-8'),
+        content_type='text/calendar',
+        content_disposition=f'attachment; filename="{file_id}.ics"'
+    )
+
+
+def reminder_image_upload_item(image_bytes, file_id, extension='png', content_type='image/png'):
+    """Describe the reminder image upload"""
+    return UploadItem(
+        name='reminder_image',
+        key=f"images/{file_id}_reminder_image.{extension}",
+        body=image_bytes,
+        content_type=content_type,
+        content_disposition=f'attachment; filename="{file_id}_reminder_image.{extension}"'
+    )
+
+
+def web_page_upload_item(html_content, page_id):
+    """Describe the web page upload"""
+    return UploadItem(
+        name='web_page',
+        key=f"pages/{page_id}.html",
+        body=html_content.encode('utf-8'),
+        content_type='text/html'
+    )
+
+
+def render_bundle(meaningful_id, pet_name, product_name, start_date, dosage, reminder_time, notes,
+                  backend=None, static_urls=None, card_profile=DEFAULT_CARD_OUTPUT_PROFILE):
+    """Render every artifact of a bundle without touching the network
+
+    Object URLs are deterministic, so with a storage backend the QR code and
+    the page are rendered once with their final URLs. Without one there is no
+    web page (and no QR PNG) and the QR code falls back to a plain text payload.
+    The card is encoded with ``card_profile`` (see reminder_core.card_output).
+    """
+    from reminder_core.calendar_ics import create_calendar_reminder
+    from reminder_core.card import QR_SIZE, create_reminder_image
+    from reminder_core.card_output import encode_card, get_card_profile
+    from reminder_core.qr import QR_LOGO_PATH, encode_png, qr_logo_image, qr_matrix
+
+    card_profile = get_card_profile(card_profile)
+    reminder_details = build_reminder_details(start_date, dosage, reminder_time, notes)
+
+    calendar_data = create_calendar_reminder(
+        pet_name=pet_name,
+        product_name=product_name,
+        dosage=dosage,
+        reminder_time=reminder_time,
+        start_date=start_date,
+        notes=notes
+    )
+    calendar_item = calendar_upload_item(calendar_data, meaningful_id)
+    upload_items = [calendar_item]
+
+    if backend is not None:
+        calendar_url = backend.url(calendar_item.key)
+        web_page_url = backend.url(f"pages/{meaningful_id}.html")
+        qr_data = web_page_url
+    else:
+        calendar_url = None
+        web_page_url = None
+        qr_data = f"data:text/plain,{pet_name} - {product_name} Reminder"
+
+    # The QR code is encoded once; the card gets it natively at its own size as an image
+    # object, and PNG bytes are only produced for the web page that embeds them
+    matrix = qr_matrix(qr_data, border=6)
+    html_content = None
+    qr_image_bytes = None
+    if web_page_url:
+        qr_image_bytes = encode_png(qr_logo_image(matrix, QR_LOGO_PATH))
+        html_content = create_web_page_html(pet_name, product_name, calendar_url, reminder_details, qr_image_bytes, static_urls)
+        upload_items.append(web_page_upload_item(html_content, meaningful_id))
+
+    # Generate the combined reminder image
+    card_qr = qr_logo_image(matrix, QR_LOGO_PATH, size=QR_SIZE)
+    reminder_image = create_reminder_image(pet_name, product_name, reminder_details, card_qr)
+
+    # Convert PIL image to bytes for download
+    reminder_image_bytes = encode_card(reminder_image, card_profile)
+    upload_items.append(reminder_image_upload_item(
+        reminder_image_bytes, meaningful_id, card_profile.extension, card_profile.content_type
+    ))
+
+    return RenderedBundle(
+        meaningful_id=meaningful_id,
+        reminder_details=reminder_details,
+        calendar_data=calendar_data,
+        qr_image_bytes=qr_image_bytes,
+        html_content=html_content,
+        reminder_image_bytes=reminder_image_bytes,
+        calendar_url=calendar_url,
+        web_page_url=web_page_url,
+        upload_items=upload_items
+    )
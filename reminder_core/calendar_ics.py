@@ -0,0 +1,149 @@
+"""iCalendar file with the monthly dosage series and the refill reminder
+
+Every reminder calendar has the same fixed shape, so create_calendar_reminder
+writes the text directly instead of building icalendar object trees. The
+output follows icalendar's property order, TEXT escaping and line folding, and
+benchmarks/ics_serializer.py checks that it parses identically to an
+icalendar-built reference.
+"""
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from dateutil.relativedelta import relativedelta
+
+PRODID = '-//Pet Medication Reminder//Boehringer Ingelheim//EN'
+
+# Timed reminders are in Singapore local time (no DST, so wall-clock arithmetic is exact)
+REMINDER_TZID = 'Asia/Singapore'
+
+_FOLD_LIMIT = 75
+
+
+def escape_text(text):
+    """RFC 5545 TEXT escaping, in the same order as icalendar"""
+    return (
+        text.replace('\\N', '\n')
+        .replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\r\n', '\\n')
+        .replace('\n', '\\n')
+        .replace('\r', '\\n')
+    )
+
+
+def fold_line(line):
+    """Fold a content line below 75 octets, never splitting a backslash escape"""
+    if len(line) < _FOLD_LIMIT and (line.isascii() or len(line.encode('utf-8')) < _FOLD_LIMIT):
+        return line
+
+    folded = []
+    current = []
+    byte_count = 0
+    for char in line:
+        char_bytes = 1 if char < '\x80' else len(char.encode('utf-8'))
+        if current and byte_count + char_bytes >= _FOLD_LIMIT:
+            if len(current) > 1 and current[-1] in '\\^':
+                escaped_prefix = current.pop()
+                folded.append(''.join(current))
+                current = [escaped_prefix]
+                byte_count = len(escaped_prefix.encode('utf-8'))
+            else:
+                folded.append(''.join(current))
+                current = []
+                byte_count = 0
+        current.append(char)
+        byte_count += char_bytes
+    folded.append(''.join(current))
+    return '\r\n '.join(folded)
+
+
+def _format_trigger(offset):
+    """DURATION value of an alarm trigger (whole hours or minutes)"""
+    sign = '-' if offset < timedelta(0) else ''
+    minutes = abs(offset) // timedelta(minutes=1)
+    hours, minutes = divmod(minutes, 60)
+    return f"{sign}PT{f'{hours}H' if hours else ''}{f'{minutes}M' if minutes else ''}"
+
+
+def _event_lines(summary, start, end, dtstamp, description, alarm_description, trigger, all_day, rrule=None, categories=None):
+    if all_day:
+        # Same form icalendar writes for vDate values
+        dtstart = f"DTSTART:{start:%Y%m%d}"
+        dtend = f"DTEND:{end:%Y%m%d}"
+        trigger_line = f"TRIGGER;RELATED=START:{_format_trigger(trigger)}"
+    else:
+        dtstart = f"DTSTART;TZID={REMINDER_TZID}:{start:%Y%m%dT%H%M%S}"
+        dtend = f"DTEND;TZID={REMINDER_TZID}:{end:%Y%m%dT%H%M%S}"
+        trigger_line = f"TRIGGER:{_format_trigger(trigger)}"
+
+    lines = [
+        'BEGIN:VEVENT',
+        fold_line(f"SUMMARY:{escape_text(summary)}"),
+        dtstart,
+        dtend,
+        f"DTSTAMP:{dtstamp}",
+        f"UID:{uuid.uuid4()}",
+    ]
+    if rrule:
+        lines.append(f"RRULE:{rrule}")
+    if categories:
+        lines.append(f"CATEGORIES:{','.join(categories)}")
+    lines += [
+        fold_line(f"DESCRIPTION:{escape_text(description)}"),
+        'BEGIN:VALARM',
+        'ACTION:DISPLAY',
+        fold_line(f"DESCRIPTION:{escape_text(alarm_description)}"),
+        trigger_line,
+        'END:VALARM',
+        'END:VEVENT',
+    ]
+    return lines
+
+
+def create_calendar_reminder(pet_name, product_name, dosage, reminder_time, start_date, notes=""):
+    """Calendar text with the monthly dosage series and the refill reminder two months in"""
+    all_day = reminder_time == '' or reminder_time is None
+    dtstamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    refill_date = start_date + relativedelta(months=2)
+
+    if all_day:
+        # All-day events; the alarms fire at 12:00 (dosage) and 10:00 (refill) on the day
+        description = f"Dosage reminder: {product_name}\nPet: {pet_name}\n{notes}"
+        start, end = start_date, start_date + timedelta(days=1)
+        refill_start, refill_end = refill_date, refill_date + timedelta(days=1)
+        trigger, refill_trigger = timedelta(hours=12), timedelta(hours=10)
+    else:
+        # One-hour timed events with alarms 15 minutes before
+        description = f"Dosage reminder: {product_name}\nPet: {pet_name}\nTime: {reminder_time}\n{notes}"
+        at = datetime.strptime(reminder_time, "%H:%M").time()
+        start = datetime.combine(start_date, at)
+        end = start + timedelta(hours=1)
+        refill_start = datetime.combine(refill_date, at)
+        refill_end = refill_start + timedelta(hours=1)
+        trigger = refill_trigger = timedelta(minutes=-15)
+
+    refill_description = f"MEDICATION REFILL REMINDER\n\nPet: {pet_name}\nMedication: {product_name}\n\nContinue to keep {pet_name} safe from parasites!"
+    if notes:
+        refill_description += f"\n\nNotes: {notes}"
+
+    lines = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        f"PRODID:{PRODID}",
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+    ]
+    lines += _event_lines(
+        f"Time to give {pet_name} {product_name}!", start, end, dtstamp, description,
+        f'Time to give {pet_name} {product_name}', trigger, all_day,
+        rrule=f"FREQ=MONTHLY;COUNT={dosage}" if dosage > 0 else "FREQ=MONTHLY"
+    )
+    lines += _event_lines(
+        f"Time to refill {pet_name}'s {product_name}", refill_start, refill_end, dtstamp, refill_description,
+        f"Time to refill {pet_name}'s {product_name}!", refill_trigger, all_day,
+        categories=['MEDICATION', 'REFILL', 'PET_CARE']
+    )
+    lines.append('END:VCALENDAR')
+    return '\r\n'.join(lines) + '\r\n'
+
@@ -0,0 +1,196 @@
+"""Business-card style reminder image
+
+Everything that is identical on every card (gradient, border, BI logo, QR
+frame and corner accents) is composited once per process into an immutable
+background layer. Each card copies that layer and only draws its own text and
+QR code on top.
+"""
+import io
+import os
+import threading
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from reminder_core.fonts import get_fallback_font
+
+# Business card dimensions (landscape orientation for sharing)
+CARD_WIDTH, CARD_HEIGHT = 1200, 800
+
+# Colors matching your web design
+BG_COLOR = (8, 49, 42)  # #08312a
+GRADIENT_END_COLOR = (10, 61, 51)
+ACCENT_COLOR = (0, 228, 124)  # #00e47c
+TEXT_COLOR = (255, 255, 255)  # white
+
+# Logo candidates, first one that loads wins
+CARD_LOGO_PATHS = ("BI-Logo-2.png", "BI-Logo.png")
+LOGO_SIZE = 172
+LOGO_X, LOGO_Y = 30, 30
+
+# QR code placement in the right half of the card
+QR_SIZE = 280
+QR_SECTION_X = CARD_WIDTH // 2 + 50
+QR_SECTION_WIDTH = CARD_WIDTH // 2 - 100
+QR_X = QR_SECTION_X + (QR_SECTION_WIDTH - QR_SIZE) // 2
+QR_Y = (CARD_HEIGHT - QR_SIZE) // 2 - 20  # Better centering
+QR_BG_PADDING = 25
+
+CORNER_SIZE = 100
+
+_background = None
+_lock = threading.Lock()
+
+
+def _gradient(width, height):
+    """Vertical gradient from BG_COLOR to GRADIENT_END_COLOR, one color per row"""
+    factor = np.arange(height) / height
+    start = np.array(BG_COLOR)
+    end = np.array(GRADIENT_END_COLOR)
+    rows = (start + (end - start) * factor[:, None]).astype(np.uint8)
+    return Image.fromarray(np.repeat(rows[:, None, :], width, axis=1), 'RGB')
+
+
+def _paste_logo(img, draw):
+    for logo_path in CARD_LOGO_PATHS:
+        if not os.path.exists(logo_path):
+            continue
+        try:
+            logo_img = Image.open(logo_path)
+            # Use thumbnail to maintain aspect ratio properly
+            logo_img.thumbnail((LOGO_SIZE, LOGO_SIZE), Image.Resampling.LANCZOS)
+            actual_w, actual_h = logo_img.size
+
+            # Center the logo in the allocated space if it's smaller
+            center_x = LOGO_X + (LOGO_SIZE - actual_w) // 2
+            center_y = LOGO_Y + (LOGO_SIZE - actual_h) // 2
+
+            if logo_img.mode == 'RGBA':
+                img.paste(logo_img, (center_x, center_y), logo_img)
+            else:
+                img.paste(logo_img, (center_x, center_y))
+            return
+        except Exception as e:
+            print(f"Error loading {logo_path}: {e}")
+
+    # Fallback: draw simple text instead of emoji
+    draw.text((LOGO_X, LOGO_Y), "BI", fill=ACCENT_COLOR, font=get_fallback_font(48))
+
+
+def build_card_background():
+    """Composite the static decoration shared by every card"""
+    img = _gradient(CARD_WIDTH, CARD_HEIGHT)
+    draw = ImageDraw.Draw(img)
+
+    # Draw decorative border
+    draw.rectangle([0, 0, CARD_WIDTH - 1, CARD_HEIGHT - 1], outline=ACCENT_COLOR, width=8)
+
+    # Draw BI Logo at top left corner
+    _paste_logo(img, draw)
+
+    # QR code background (white rectangle with accent outline)
+    draw.rectangle(
+        [QR_X - QR_BG_PADDING, QR_Y - QR_BG_PADDING, QR_X + QR_SIZE + QR_BG_PADDING, QR_Y + QR_SIZE + QR_BG_PADDING],
+        fill=TEXT_COLOR, outline=ACCENT_COLOR, width=3
+    )
+
+    # Top right and bottom left corner accents
+    draw.rectangle([CARD_WIDTH - CORNER_SIZE, 0, CARD_WIDTH, CORNER_SIZE], fill=ACCENT_COLOR)
+    draw.rectangle([0, CARD_HEIGHT - CORNER_SIZE, CORNER_SIZE, CARD_HEIGHT], fill=ACCENT_COLOR)
+
+    return img
+
+
+def get_card_background():
+    """Return the shared background layer; callers must copy() before drawing"""
+    global _background
+    if _background is None:
+        with _lock:
+            if _background is None:
+                _background = build_card_background()
+    return _background
+
+
+def create_reminder_image(pet_name, product_name, reminder_details, qr_code):
+    """Create a professional business card style reminder image with cloud-compatible fonts
+
+    Args:
+        qr_code: QR code as a QR_SIZE x QR_SIZE image (see reminder_core.qr.qr_logo_image),
+            or PNG bytes, which are decoded and resized to fit
+    """
+
+    img = get_card_background().copy()
+    draw = ImageDraw.Draw(img)
+
+    # Get fallback fonts with better sizing for cloud deployment
+    try:
+        large_font = get_fallback_font(48)
+        title_font = get_fallback_font(32)
+        detail_font = get_fallback_font(20)
+        small_font = get_fallback_font(18)
+    except Exception:
+        # Ultimate fallback - use default font
+        base_font = ImageFont.load_default()
+        large_font = base_font
+        title_font = base_font
+        detail_font = base_font
+        small_font = base_font
+
+    # LEFT SIDE: Pet info and details (REDUCED SPACING)
+    left_x = 60
+
+    # Pet name (move up to reduce space)
+    pet_y = 180  # Reduced from higher value
+    draw.text((left_x, pet_y), pet_name.upper(), fill=ACCENT_COLOR, font=large_font)
+
+    # Product name (tighter spacing)
+    product_y = pet_y + 60  # Reduced spacing
+    draw.text((left_x, product_y), '('+product_name+')', fill=TEXT_COLOR, font=title_font)
+
+    # Details section (tighter spacing) - REPLACE ICONS WITH TEXT SYMBOLS
+    details_y = product_y + 60  # Reduced spacing
+
+    # Format frequency better
+    frequency_text = reminder_details['frequency']
+
+    details = [
+        " ",
+        f"• Frequency: {frequency_text}",
+        f"• Starts: {reminder_details['start_date']}",
+        f"• Duration: {reminder_details['duration']}",
+        f"• Total: {reminder_details['total_reminders']} reminders",
+        " "
+    ]
+
+    for i, detail in enumerate(details):
+        draw.text((left_x, details_y + i * 25), detail, fill=TEXT_COLOR, font=detail_font)
+
+    # Times section (tighter spacing) - REPLACE ICON WITH TEXT
+    times_y = details_y + len(details) * 25 + 15  # Reduced spacing
+    draw.text((left_x, times_y), "Reminder Time:", fill=ACCENT_COLOR, font=detail_font)
+
+    times_text = reminder_details['times']
+    draw.text((left_x + 20, times_y + 30), f"{times_text}", fill=TEXT_COLOR, font=small_font)
+
+    # Notes if present (tighter spacing) - REPLACE ICON WITH TEXT
+    if reminder_details.get('notes') and reminder_details['notes'].strip():
+        notes_y = times_y + 80  # Adjusted spacing for new layout
+        draw.text((left_x, notes_y), "Additional Notes:", fill=ACCENT_COLOR, font=detail_font)
+
+        # Wrap notes text
+        notes_text = reminder_details['notes']
+        max_chars = 40
+        if len(notes_text) > max_chars:
+            notes_text = notes_text[:max_chars-3] + "..."
+
+        draw.text((left_x + 20, notes_y + 30), notes_text, fill=TEXT_COLOR, font=small_font)
+
+    # RIGHT SIDE: QR Code on its pre-drawn frame
+    qr_img = qr_code
+    if isinstance(qr_img, bytes):
+        qr_img = Image.open(io.BytesIO(qr_img))
+    if qr_img.size != (QR_SIZE, QR_SIZE):
+        qr_img = qr_img.resize((QR_SIZE, QR_SIZE), Image.Resampling.LANCZOS)
+    img.paste(qr_img, (QR_X, QR_Y))
+
+    return img
@@ -0,0 +1,49 @@
+"""Output profiles for the stored and downloaded reminder card
+
+The card is a flat graphic (a two-tone gradient, text and a QR code), so it
+quantizes to a palette without visible loss; the profiles trade encode time
+against the bytes stored under ``images/``. Compare them with
+
+    python -m benchmarks.card_encoders
+"""
+import io
+from collections import namedtuple
+
+CardProfile = namedtuple('CardProfile', ['name', 'format', 'extension', 'content_type', 'save_options', 'palette'])
+
+CARD_OUTPUT_PROFILES = {
+    # zlib level 6, the Pillow default; what the card has always been stored as
+    'png': CardProfile('png', 'PNG', 'png', 'image/png', {'dpi': (300, 300)}, False),
+    'png-fast': CardProfile('png-fast', 'PNG', 'png', 'image/png', {'dpi': (300, 300), 'compress_level': 1}, False),
+    # 256-color palette: about a third of the bytes of 'png' at a lower encode time
+    'png-palette': CardProfile('png-palette', 'PNG', 'png', 'image/png', {'dpi': (300, 300)}, True),
+    'webp': CardProfile('webp', 'WEBP', 'webp', 'image/webp', {'quality': 90, 'method': 2}, False),
+    'jpeg': CardProfile('jpeg', 'JPEG', 'jpg', 'image/jpeg', {'dpi': (300, 300), 'quality': 90, 'optimize': True}, False),
+}
+
+DEFAULT_CARD_OUTPUT_PROFILE = 'png'
+
+
+def get_card_profile(name):
+    """Return the named profile, raising ValueError for unknown names"""
+    try:
+        return CARD_OUTPUT_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown card output profile {name!r}; expected one of {', '.join(CARD_OUTPUT_PROFILES)}"
+        ) from None
+
+
+def encode_card(image, profile=DEFAULT_CARD_OUTPUT_PROFILE):
+    """Encode the card image with a profile (name or CardProfile) and return the bytes"""
+    if isinstance(profile, str):
+        profile = get_card_profile(profile)
+
+    if profile.palette:
+        from PIL import Image
+
+        image = image.quantize(256, method=Image.Quantize.FASTOCTREE)
+
+    img_buffer = io.BytesIO()
+    image.save(img_buffer, format=profile.format, **profile.save_options)
+    return img_buffer.getvalue()
@@ -0,0 +1,140 @@
+"""Settings of the reminder pipeline, readable without Streamlit
+
+Every setting is looked up in an optional mapping first (the app passes
+``st.secrets``) and then in environment variables. Invalid settings are
+replaced by their defaults when the config is loaded and reported in its
+``warnings``, so a typo never fails individual submits.
+"""
+import os
+from collections import namedtuple
+
+from reminder_core.backends import STORAGE_BACKENDS
+from reminder_core.card_output import CARD_OUTPUT_PROFILES, DEFAULT_CARD_OUTPUT_PROFILE
+from reminder_core.routing import parse_storage_routes, resolve_route
+from reminder_core.storage import DEFAULT_S3_TRANSPORT, S3Transport
+
+ReminderConfig = namedtuple('ReminderConfig', [
+    'region', 'bucket', 'aws_access_key_id', 'aws_secret_access_key',
+    'content_addressed_bundles', 'shared_static_assets', 'card_output_profile', 'market', 'storage_routes',
+    's3_transport', 'storage_backend', 'local_storage_dir', 'local_storage_url',
+    'write_behind_uploads', 'upload_journal_dir', 'warnings'
+])
+
+
+def get_setting(name, default=None, secrets=None):
+    """Read a setting from ``secrets``, falling back to environment variables"""
+    if secrets is not None:
+        try:
+            if name in secrets:
+                return secrets[name]
+        except Exception:
+            # st.secrets raises when there is no secrets.toml (local development)
+            pass
+    return os.getenv(name, default)
+
+
+def get_flag(name, default, secrets=None):
+    """Boolean setting; '1', 'true' and 'yes' (any case) are true"""
+    return str(get_setting(name, default, secrets)).lower() in ('1', 'true', 'yes')
+
+
+# S3Transport field: (setting, parser); parsers raise ValueError on bad values
+S3_TRANSPORT_SETTINGS = {
+    'max_pool_connections': ('S3_MAX_POOL_CONNECTIONS', int),
+    'connect_timeout': ('S3_CONNECT_TIMEOUT', float),
+    'read_timeout': ('S3_READ_TIMEOUT', float),
+    'retry_mode': ('S3_RETRY_MODE', str),
+    'max_attempts': ('S3_MAX_ATTEMPTS', int),
+}
+
+# Retry modes botocore supports
+S3_RETRY_MODES = ('legacy', 'standard', 'adaptive')
+
+
+def load_s3_transport(secrets=None):
+    """S3 transport settings as given, each falling back to reminder_core.storage's default when unset
+
+    The values are parsed (and checked) by validate_config.
+    """
+    return S3Transport(**{
+        field: get_setting(name, getattr(DEFAULT_S3_TRANSPORT, field), secrets)
+        for field, (name, _) in S3_TRANSPORT_SETTINGS.items()
+    })
+
+
+def _parse_s3_transport(transport, warnings):
+    values = {}
+    for field, (name, parse) in S3_TRANSPORT_SETTINGS.items():
+        default = getattr(DEFAULT_S3_TRANSPORT, field)
+        try:
+            value = parse(str(getattr(transport, field)).strip())
+            if parse is str and value not in S3_RETRY_MODES:
+                raise ValueError(f"expected one of {', '.join(S3_RETRY_MODES)}")
+            if parse is not str and value <= 0:
+                raise ValueError("must be positive")
+        except ValueError as e:
+            warnings.append(f"Invalid {name} {getattr(transport, field)!r} ({e}); using {default!r}")
+            value = default
+        values[field] = value
+    return S3Transport(**values)
+
+
+def validate_config(config):
+    """Replace invalid settings by their defaults and list what was replaced in ``warnings``"""
+    warnings = list(config.warnings)
+    if config.card_output_profile not in CARD_OUTPUT_PROFILES:
+        warnings.append(
+            f"Unknown CARD_OUTPUT_PROFILE {config.card_output_profile!r} (expected one of "
+            f"{', '.join(CARD_OUTPUT_PROFILES)}); using {DEFAULT_CARD_OUTPUT_PROFILE!r}"
+        )
+        config = config._replace(card_output_profile=DEFAULT_CARD_OUTPUT_PROFILE)
+    config = config._replace(s3_transport=_parse_s3_transport(config.s3_transport, warnings))
+    storage_backend = str(config.storage_backend or 's3').strip().lower()
+    if storage_backend not in STORAGE_BACKENDS:
+        warnings.append(
+            f"Unknown STORAGE_BACKEND {config.storage_backend!r} (expected one of "
+            f"{', '.join(STORAGE_BACKENDS)}); using 's3'"
+        )
+        storage_backend = 's3'
+    config = config._replace(storage_backend=storage_backend)
+    try:
+        parse_storage_routes(config.storage_routes)
+    except ValueError as e:
+        warnings.append(f"{e}; ignoring STORAGE_ROUTES and using the default bucket")
+        config = config._replace(storage_routes='', market='')
+    try:
+        resolve_route(config)
+    except ValueError as e:
+        warnings.append(f"{e}; using the default bucket")
+        config = config._replace(market='')
+    return config._replace(warnings=tuple(warnings))
+
+
+def load_config(secrets=None):
+    """Build the pipeline settings from ``secrets`` and the environment"""
+    return validate_config(ReminderConfig(
+        region=get_setting('AWS_REGION', 'us-east-1', secrets),
+        bucket=get_setting('S3_BUCKET_NAME', 'pet-reminder', secrets),
+        aws_access_key_id=get_setting('AWS_ACCESS_KEY_ID', None, secrets),
+        aws_secret_access_key=get_setting('AWS_SECRET_ACCESS_KEY', None, secrets),
+        # Reuse the existing bundle when identical reminder details are resubmitted
+        content_addressed_bundles=get_flag('CONTENT_ADDRESSED_BUNDLES', 'true', secrets),
+        # Link generated pages to shared, content-hashed assets under static/ instead of inlining them
+        shared_static_assets=get_flag('SHARED_STATIC_ASSETS', 'false', secrets),
+        # Encoding of the stored card, see reminder_core.card_output.CARD_OUTPUT_PROFILES
+        card_output_profile=get_setting('CARD_OUTPUT_PROFILE', DEFAULT_CARD_OUTPUT_PROFILE, secrets),
+        # Market served by this deployment and the bucket of each market, see reminder_core.routing
+        market=get_setting('MARKET', '', secrets),
+        storage_routes=get_setting('STORAGE_ROUTES', '', secrets),
+        # Connection pool, timeouts and retries of the S3 clients, see reminder_core.storage
+        s3_transport=load_s3_transport(secrets),
+        # 's3', 'local' or 'memory', see reminder_core.backends
+        storage_backend=get_setting('STORAGE_BACKEND', 's3', secrets),
+        local_storage_dir=get_setting('LOCAL_STORAGE_DIR', 'storage', secrets),
+        # Base URL the local directory is served from; file:// URLs when unset
+        local_storage_url=get_setting('LOCAL_STORAGE_URL', '', secrets),
+        # Only wait for the web page; card and calendar are journaled and uploaded in the background
+        write_behind_uploads=get_flag('WRITE_BEHIND_UPLOADS', 'false', secrets),
+        upload_journal_dir=get_setting('UPLOAD_JOURNAL_DIR', 'upload_journal', secrets),
+        warnings=()
+    ))
@@ -0,0 +1,71 @@
+"""Content-addressed lookup of previously generated reminder bundles
+
+A canonical hash of the generation inputs maps to a small JSON record under
+``index/`` that points at the bundle's existing objects in ``calendars/``,
+``pages/`` and ``images/``. An identical request is answered from that record
+with a single GET and no rendering or uploads.
+"""
+import hashlib
+import json
+from datetime import datetime, timezone
+
+from reminder_core.backends import PreconditionFailed
+
+INDEX_PREFIX = 'index/'
+
+# Bump when the rendered output changes so old bundles stop matching
+FINGERPRINT_VERSION = 1
+
+
+def bundle_fingerprint(pet_name, product_name, start_date, dosage, reminder_time, notes, household=None):
+    """Canonical SHA-256 of the inputs that determine a bundle's content"""
+    canonical = {
+        'v': FINGERPRINT_VERSION,
+        'pet_name': pet_name.strip(),
+        'product_name': product_name.strip(),
+        'start_date': start_date.isoformat(),
+        'dosage': int(dosage),
+        'reminder_time': reminder_time or '',
+        'notes': (notes or '').strip(),
+    }
+    if household:
+        # Only present when set, so bundles without a household keep their fingerprints
+        canonical['household'] = household
+    payload = json.dumps(canonical, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def index_key(fingerprint):
+    """Object key of the index record for a fingerprint"""
+    return f"{INDEX_PREFIX}{fingerprint}.json"
+
+
+def lookup_bundle(backend, fingerprint):
+    """Return the stored bundle record for a fingerprint, or None"""
+    record = backend.get(index_key(fingerprint))
+    if record is None:
+        return None
+    return json.loads(record.body.decode('utf-8'))
+
+
+def record_bundle(backend, fingerprint, meaningful_id, urls):
+    """Store the index record for a freshly uploaded bundle
+
+    The first writer wins, so concurrent identical submits all converge on
+    a single bundle for later lookups. Returns False if one already existed.
+    """
+    record = {
+        'meaningful_id': meaningful_id,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        **urls,
+    }
+    try:
+        backend.put(
+            index_key(fingerprint),
+            json.dumps(record).encode('utf-8'),
+            'application/json',
+            if_none_match=True
+        )
+    except PreconditionFailed:
+        return False
+    return True
@@ -0,0 +1,97 @@
+"""Process-wide font registry for rendering the reminder card
+
+The best available font file is resolved once per process and each size is
+loaded once, so card renders stop probing the filesystem and re-parsing
+TrueType files on every request.
+"""
+import os
+import threading
+
+from PIL import ImageFont
+
+FONT_CANDIDATES = [
+    # Common Windows fonts
+    "C:/Windows/Fonts/arial.ttf",
+    "C:/Windows/Fonts/calibri.ttf",
+    "C:/Windows/Fonts/segoeui.ttf",
+    # Common macOS fonts
+    "/System/Library/Fonts/Arial.ttf",
+    "/System/Library/Fonts/Helvetica.ttc",
+    # Common Linux fonts
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/TTF/arial.ttf",
+    # Streamlit Cloud / Ubuntu fonts
+    "/usr/share/fonts/truetype/ubuntu/Ubuntu-R.ttf",
+    "/usr/share/fonts/truetype/ubuntu/Ubuntu-B.ttf",
+]
+
+# Sizes used by create_reminder_image
+CARD_FONT_SIZES = (48, 32, 20, 18)
+
+
+class FontRegistry:
+    """Resolve the best font file once and cache one font object per size"""
+
+    def __init__(self, candidates=FONT_CANDIDATES):
+        self.candidates = candidates
+        self._lock = threading.Lock()
+        self._resolved = False
+        self._path = None
+        self._fonts = {}
+
+    @property
+    def path(self):
+        """Font file in use, or None when falling back to Pillow's default font"""
+        with self._lock:
+            self._resolve()
+            return self._path
+
+    def _resolve(self):
+        if self._resolved:
+            return
+        for font_path in self.candidates:
+            if os.path.exists(font_path):
+                try:
+                    ImageFont.truetype(font_path, 12)
+                except Exception:
+                    continue
+                self._path = font_path
+                break
+        self._resolved = True
+
+    def get(self, size):
+        """Return the font at ``size``, loading it on first use"""
+        font = self._fonts.get(size)
+        if font is not None:
+            return font
+
+        with self._lock:
+            font = self._fonts.get(size)
+            if font is None:
+                self._resolve()
+                if self._path:
+                    font = ImageFont.truetype(self._path, size)
+                else:
+                    # If no fonts found, use default
+                    font = ImageFont.load_default()
+                self._fonts[size] = font
+            return font
+
+    def warm_up(self, sizes=CARD_FONT_SIZES):
+        """Load every size up front so the first card render does not pay for it"""
+        for size in sizes:
+            self.get(size)
+
+
+font_registry = FontRegistry()
+
+
+def get_fallback_font(size):
+    """Get the best available font for the system"""
+    return font_registry.get(size)
+
+
+def warm_up_fonts(sizes=CARD_FONT_SIZES):
+    """Warm-up hook: resolve the font family and load the card sizes"""
+    font_registry.warm_up(sizes)
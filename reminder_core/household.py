@@ -0,0 +1,134 @@
+"""Per-household calendar feed that calendar apps can subscribe to
+
+The first pet of a household gets an unguessable household ID (a slug of the
+name plus a random token), since the feed holds pet names and notes and is
+served publicly. Later pets join by entering that ID; a plain name always
+starts a new household. Every pet added to a household appends its medication
+and refill events to ``households/{id}.ics``. The new VEVENT blocks are spliced into the existing
+text just before ``END:VCALENDAR``, so an update is one GET and one
+ETag-conditional PUT no matter how many series the feed already holds;
+nothing is parsed or regenerated. A writer that loses the race re-reads the
+feed and splices again.
+"""
+import random
+import re
+import secrets
+import time
+
+from reminder_core.backends import PreconditionFailed
+
+HOUSEHOLD_PREFIX = 'households/'
+
+# Attempts at winning the conditional write before giving up
+HOUSEHOLD_UPDATE_ATTEMPTS = 20
+
+# Subscribers must always see the latest events
+HOUSEHOLD_CACHE_CONTROL = 'no-cache'
+
+# Random part of a household ID (80 bits, hex)
+HOUSEHOLD_TOKEN_BYTES = 10
+
+_FEED_END = 'END:VCALENDAR\r\n'
+
+_HOUSEHOLD_ID = re.compile(rf'^(?:([a-z0-9-]+)-)?[0-9a-f]{{{HOUSEHOLD_TOKEN_BYTES * 2}}}$')
+
+
+def household_slug(household):
+    """Lower-case slug of a household name or ID, or None when no household was given"""
+    slug = re.sub(r'[^a-z0-9]+', '-', (household or '').strip().lower()).strip('-')
+    return slug[:40 + 1 + HOUSEHOLD_TOKEN_BYTES * 2] or None
+
+
+def is_household_id(household):
+    """Whether ``household`` is an issued household ID rather than a name"""
+    return bool(_HOUSEHOLD_ID.match((household or '').strip().lower()))
+
+
+def issue_household_id(household):
+    """ID of the household to append to: the given ID, a new one for a name, or None"""
+    if is_household_id(household):
+        return household.strip().lower()
+    slug = household_slug(household)
+    if slug is None:
+        return None
+    return f"{slug[:40].rstrip('-')}-{secrets.token_hex(HOUSEHOLD_TOKEN_BYTES)}"
+
+
+def household_key(household_id):
+    """Object key of a household's feed"""
+    return f"{HOUSEHOLD_PREFIX}{household_id}.ics"
+
+
+def new_feed(household):
+    """Empty VCALENDAR for a household, with the name shown by calendar apps"""
+    from reminder_core.calendar_ics import escape_text, fold_line
+
+    if is_household_id(household):
+        # Created from an ID (batch runs, or an ID typed before its feed existed): show the name part only
+        household = _HOUSEHOLD_ID.match(household.strip().lower()).group(1) or 'Household'
+    return (
+        'BEGIN:VCALENDAR\r\n'
+        'VERSION:2.0\r\n'
+        'PRODID:-//Pet Medication Reminder//Boehringer Ingelheim//EN\r\n'
+        'CALSCALE:GREGORIAN\r\n'
+        'METHOD:PUBLISH\r\n'
+        + fold_line(f'X-WR-CALNAME:{escape_text(household.strip())} pet reminders') + '\r\n'
+        + _FEED_END
+    )
+
+
+def calendar_events(calendar_data):
+    """The VEVENT blocks (with their alarms) of a single-pet calendar, as raw text"""
+    start = calendar_data.index('BEGIN:VEVENT')
+    end = calendar_data.rindex('END:VEVENT\r\n') + len('END:VEVENT\r\n')
+    return calendar_data[start:end]
+
+
+def splice_events(feed, events):
+    """Insert raw VEVENT text just before the feed's END:VCALENDAR"""
+    end = feed.rindex(_FEED_END)
+    return feed[:end] + events + feed[end:]
+
+
+def _first_uid_line(events):
+    match = re.search(r'^UID:.*\r$', events, re.MULTILINE)
+    return match.group(0) if match else None
+
+
+def append_to_household(backend, household_id, calendar_data, name=None, max_attempts=HOUSEHOLD_UPDATE_ATTEMPTS):
+    """Append a pet's events to a household's feed (see issue_household_id) and return the feed's URL
+
+    ``name`` titles a feed created by this call. Raises RuntimeError when the
+    conditional write keeps losing the race.
+    """
+    key = household_key(household_id)
+    events = calendar_events(calendar_data)
+    uid_line = _first_uid_line(events)
+
+    for attempt in range(max_attempts):
+        current = backend.get(key)
+        if current is not None:
+            feed = current.body.decode('utf-8')
+            condition = {'if_match': current.etag}
+        else:
+            feed = new_feed(name or household_id)
+            condition = {'if_none_match': True}
+
+        if uid_line and uid_line in feed:
+            # Already appended by an earlier attempt whose response was lost
+            return backend.url(key)
+
+        try:
+            backend.put(
+                key,
+                splice_events(feed, events).encode('utf-8'),
+                'text/calendar',
+                cache_control=HOUSEHOLD_CACHE_CONTROL,
+                **condition
+            )
+            return backend.url(key)
+        except PreconditionFailed:
+            # Another pet was added to the household meanwhile - back off and splice again
+            time.sleep(random.uniform(0, 0.05 * (attempt + 1)))
+
+    raise RuntimeError(f"Could not update {key} after {max_attempts} attempts")
@@ -0,0 +1,228 @@
+"""Write-behind upload journal: acknowledge now, upload in the background
+
+With ``WRITE_BEHIND_UPLOADS`` a submit only waits for the web page (the URL
+in the QR code). The card and calendar are written to a journal on local disk
+and acknowledged immediately; a daemon thread drains the journal to the
+storage backend, retrying with backoff until every object is stored.
+
+Each entry is a body file plus a JSON header written last (atomically), so a
+crash never leaves a half-written entry behind; the directory is fsynced before
+an entry is acknowledged, so it also survives a host crash. Bodies without a
+header and temporary files that a crash left behind are deleted by the drain
+worker once they are older than ``JOURNAL_ORPHAN_AGE``. Drains upload over
+their own small thread pool, never the one that serves submits. Every backend has its own
+journal directory under ``UPLOAD_JOURNAL_DIR``, and entries left by an earlier
+process are drained as soon as that backend is used again.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from reminder_core.backends import PreconditionFailed
+from reminder_core.uploads import UploadItem, upload_bundle
+
+# Backoff between failed drain rounds, doubling up to the cap
+JOURNAL_RETRY_INITIAL = 1
+JOURNAL_RETRY_MAX = 60
+
+# Entries uploaded per drain round
+JOURNAL_DRAIN_BATCH = 32
+
+# Seconds before a body without a header, or a temporary file, counts as left behind by a crash
+# (an entry being enqueued has its header written within moments)
+JOURNAL_ORPHAN_AGE = 10 * 60
+
+# Concurrent PUTs of all drains in the process, kept apart from the submit pool (uploads.UPLOAD_MAX_WORKERS)
+JOURNAL_UPLOAD_WORKERS = 2
+
+_journals = {}
+_executor = None
+_lock = threading.Lock()
+
+
+def get_upload_journal(backend, directory):
+    """Return the process-wide journal for a backend, starting its drain worker once"""
+    # The backend's base URL identifies its bucket (and region) across restarts
+    name = hashlib.sha256(backend.url('').encode('utf-8')).hexdigest()[:16]
+    path = os.path.abspath(os.path.join(directory, name))
+    with _lock:
+        journal = _journals.get(path)
+        if journal is None:
+            journal = UploadJournal(backend, path)
+            journal.start()
+            _journals[path] = journal
+        return journal
+
+
+def _get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=JOURNAL_UPLOAD_WORKERS, thread_name_prefix="journal-upload")
+        return _executor
+
+
+def _fsync_directory(path):
+    # Makes the renames into the directory durable
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_write(path, data):
+    temp = f"{path}.tmp"
+    with open(temp, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp, path)
+
+
+class UploadJournal:
+    """Durable queue of UploadItems drained to one StorageBackend"""
+
+    def __init__(self, backend, directory):
+        self.backend = backend
+        self.directory = directory
+        self._wake = threading.Event()
+        self._idle = threading.Condition()
+        self._thread = None
+        self.last_error = None
+        os.makedirs(directory, exist_ok=True)
+
+    def start(self):
+        """Start the drain worker (also picks up entries left by an earlier process)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="upload-journal", daemon=True)
+            self._thread.start()
+            self._wake.set()
+
+    def enqueue(self, items):
+        """Persist items to the journal and return {name: url}; the uploads happen later"""
+        urls = {}
+        for item in items:
+            # Time-ordered names, so entries drain roughly in submit order
+            entry = f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}"
+            _fsync_write(os.path.join(self.directory, f"{entry}.body"), item.body)
+            header = item._replace(body=None)._asdict()
+            _fsync_write(os.path.join(self.directory, f"{entry}.json"), json.dumps(header).encode('utf-8'))
+            urls[item.name] = self.backend.url(item.key)
+        _fsync_directory(self.directory)
+        self._wake.set()
+        return urls
+
+    def put(self, key, body, content_type, cache_control=None, content_disposition=None,
+            if_match=None, if_none_match=False):
+        """StorageBackend.put for deferred writes; create-only conflicts are dropped at drain time"""
+        if if_match:
+            raise ValueError("Compare-and-swap writes cannot be deferred")
+        item = UploadItem(key, key, body, content_type, content_disposition, cache_control, if_none_match)
+        self.enqueue([item])
+
+    def url(self, key):
+        return self.backend.url(key)
+
+    def pending(self):
+        """Entry names still waiting to be uploaded, oldest first"""
+        return sorted(name[:-len('.json')] for name in os.listdir(self.directory) if name.endswith('.json'))
+
+    def wait_until_drained(self, timeout=None):
+        """Block until the journal is empty; returns False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while self.pending():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._wake.set()
+                self._idle.wait(remaining if remaining is not None else 1)
+        return True
+
+    def _load(self, entry):
+        with open(os.path.join(self.directory, f"{entry}.json"), 'rb') as f:
+            header = json.loads(f.read().decode('utf-8'))
+        with open(os.path.join(self.directory, f"{entry}.body"), 'rb') as f:
+            header['body'] = f.read()
+        # Entry name doubles as the result key, so two items with one name never collide
+        return UploadItem(**{**header, 'name': entry})
+
+    def _remove(self, entry):
+        for suffix in ('.json', '.body'):
+            try:
+                os.remove(os.path.join(self.directory, f"{entry}{suffix}"))
+            except FileNotFoundError:
+                pass
+
+    def remove_orphans(self, max_age=JOURNAL_ORPHAN_AGE):
+        """Delete bodies without a header and temporary files older than ``max_age`` seconds; returns how many"""
+        names = set(os.listdir(self.directory))
+        cutoff = time.time() - max_age
+        removed = 0
+        for name in names:
+            if not (name.endswith('.tmp') or (name.endswith('.body') and f"{name[:-len('.body')]}.json" not in names)):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except FileNotFoundError:
+                # Completed or drained meanwhile
+                pass
+        return removed
+
+    def drain_once(self):
+        """Upload one batch of pending entries and return how many were stored"""
+        self.remove_orphans()
+        entries = self.pending()[:JOURNAL_DRAIN_BATCH]
+        items = []
+        for entry in entries:
+            try:
+                items.append(self._load(entry))
+            except FileNotFoundError:
+                # Drained meanwhile by another process sharing the directory
+                continue
+            except (OSError, ValueError, TypeError) as e:
+                # Corrupt entry; it can never be uploaded
+                self.last_error = e
+                self._remove(entry)
+        stored = 0
+        results = upload_bundle(self.backend, items, _get_executor())
+        for item in items:
+            result = results[item.name]
+            if result.ok or isinstance(result.error, PreconditionFailed):
+                # Create-only objects that already exist count as stored
+                self._remove(item.name)
+                stored += 1
+            else:
+                self.last_error = result.error
+        return stored
+
+    def _run(self):
+        delay = JOURNAL_RETRY_INITIAL
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            while True:
+                try:
+                    stored = self.drain_once()
+                    remaining = len(self.pending())
+                except Exception as e:
+                    self.last_error = e
+                    stored, remaining = 0, 1
+                with self._idle:
+                    self._idle.notify_all()
+                if not remaining:
+                    delay = JOURNAL_RETRY_INITIAL
+                    break
+                if not stored:
+                    # No progress: storage is down, back off before the next round
+                    self._wake.wait(delay)
+                    self._wake.clear()
+                    delay = min(delay * 2, JOURNAL_RETRY_MAX)
@@ -0,0 +1,178 @@
+"""QR code rendering for reminder pages and cards"""
+import io
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import qrcode
+from PIL import Image
+
+# Logo placed in the middle of every QR code
+QR_LOGO_PATH = "./assets/logos/NGS_X_blue.jpg"
+
+# Prepared logo tiles kept per (logo path, QR pixel size, padding); a few KB to ~100 KB each
+QR_LOGO_CACHE_SIZE = 32
+
+
+def qr_matrix(data, border):
+    """Module matrix of the QR code for ``data`` (True = dark), including the quiet-zone border"""
+    qr = qrcode.QRCode(
+        version=2,
+        error_correction=qrcode.constants.ERROR_CORRECT_M,
+        border=border,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    return np.array(qr.get_matrix(), dtype=bool)
+
+
+def render_qr_matrix(matrix, box_size):
+    """Black-on-white RGBA image of a module matrix, each module ``box_size`` pixels wide"""
+    pixels = np.where(matrix, 0, 255).astype(np.uint8)
+    pixels = pixels.repeat(box_size, axis=0).repeat(box_size, axis=1)
+    return Image.fromarray(pixels, 'L').convert('RGBA')
+
+
+def render_qr_matrix_to_size(matrix, size):
+    """Black-on-white RGBA image of a module matrix at exactly ``size`` pixels
+
+    Every output pixel takes the module it falls in, so modules stay crisp when
+    ``size`` is not a multiple of the matrix width (no resampling blur).
+    """
+    index = np.arange(size) * len(matrix) // size
+    pixels = np.where(matrix[np.ix_(index, index)], 0, 255).astype(np.uint8)
+    return Image.fromarray(pixels, 'L').convert('RGBA')
+
+
+def _dark_runs(matrix):
+    """(row, first column, column after last) of every horizontal run of dark modules"""
+    padded = np.pad(matrix.astype(np.int8), ((0, 0), (1, 1)))
+    edges = np.diff(padded, axis=1)
+    starts = np.argwhere(edges == 1)
+    ends = np.argwhere(edges == -1)
+    return zip(starts[:, 0].tolist(), starts[:, 1].tolist(), ends[:, 1].tolist())
+
+
+def generate_qr_svg(web_page_url):
+    """Generate QR code as SVG string for HTML embedding"""
+    matrix = qr_matrix(web_page_url, border=4)
+    size = len(matrix)
+
+    # One rectangle per horizontal run of dark modules, in a single path (1 module = 1 mm)
+    path = ''.join(f"M{x0},{y}H{x1}V{y + 1}H{x0}z" for y, x0, x1 in _dark_runs(matrix))
+
+    return (
+        f'<svg width="{size}mm" height="{size}mm" version="1.1" viewBox="0 0 {size} {size}" '
+        f'xmlns="http://www.w3.org/2000/svg"><path d="{path}" id="qr-path" fill="#000000" '
+        f'fill-opacity="1" fill-rule="nonzero" stroke="none" /></svg>'
+    )
+
+
+def build_logo_tile(logo_path, qr_size, padding):
+    """Logo scaled to 20% of the QR width on a padded white background"""
+    logo = Image.open(logo_path).convert("RGBA")
+
+    # Preserve aspect ratio, scale to fit within maximum dimensions
+    max_logo_size = int(qr_size * 0.2)  # 20% of QR code width
+
+    # Calculate scaling factor to fit logo within max dimensions
+    logo_width, logo_height = logo.size
+    scale_factor = min(max_logo_size / logo_width, max_logo_size / logo_height)
+
+    new_width = int(logo_width * scale_factor)
+    new_height = int(logo_height * scale_factor)
+
+    logo_resized = logo.resize((new_width, new_height), resample=Image.Resampling.LANCZOS)
+
+    # Create background with padding
+    bg_width = new_width + (padding * 2)
+    bg_height = new_height + (padding * 2)
+    logo_background = Image.new('RGBA', (bg_width, bg_height), (255, 255, 255, 255))
+
+    # Paste logo onto background with padding
+    logo_pos = (padding, padding)
+    logo_background.paste(logo_resized, logo_pos, mask=logo_resized)
+
+    return logo_background
+
+
+class LogoTileCache:
+    """LRU cache of prepared logo tiles keyed by (logo path, QR pixel size, padding)
+
+    Entries are revalidated against the logo file's mtime and size, and tiles
+    are shared read-only between threads.
+    """
+
+    def __init__(self, max_entries=QR_LOGO_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, logo_path, qr_size, padding):
+        """Return the tile, building it on a miss"""
+        try:
+            stat = os.stat(logo_path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+
+        key = (logo_path, qr_size, padding)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        tile = build_logo_tile(logo_path, qr_size, padding)
+        with self._lock:
+            self._entries[key] = (stamp, tile)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return tile
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+logo_tile_cache = LogoTileCache()
+
+
+def qr_logo_image(matrix, logo_path, padding=8, size=None):
+    """QR code image with the logo tile centered on it
+
+    Args:
+        matrix: Module matrix from qr_matrix
+        size: Pixel width to render at natively; by default 12 px per module.
+            The logo padding is scaled with it so the result matches a resized full-size code.
+    """
+    if size is None:
+        # Painted straight from the module matrix with array operations (12 px per module)
+        qr_img = render_qr_matrix(matrix, box_size=12)
+    else:
+        qr_img = render_qr_matrix_to_size(matrix, size)
+        padding = round(padding * size / (12 * len(matrix)))
+    qr_width, qr_height = qr_img.size
+
+    # Only the final paste happens per QR code; the prepared tile is cached per size
+    logo_background = logo_tile_cache.get(logo_path, qr_width, padding)
+    bg_width, bg_height = logo_background.size
+
+    # Center the logo with background on QR code
+    pos = ((qr_width - bg_width) // 2, (qr_height - bg_height) // 2)
+    qr_img.paste(logo_background, pos, mask=logo_background)
+    return qr_img
+
+
+def encode_png(image):
+    """PNG bytes of an image, for artifacts that are stored or downloaded"""
+    img_buffer = io.BytesIO()
+    image.save(img_buffer, format='PNG')
+    return img_buffer.getvalue()
+
+
+def generate_qr_code_preserve_aspect(web_page_url, logo_path, padding=8):
+    """Generate QR code with logo preserving aspect ratio and padding"""
+    return encode_png(qr_logo_image(qr_matrix(web_page_url, border=6), logo_path, padding))
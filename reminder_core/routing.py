@@ -0,0 +1,77 @@
+"""Route each market to the bucket (and region) nearest to it
+
+``STORAGE_ROUTES`` maps market codes to ``region/bucket`` pairs, either as a
+string::
+
+    STORAGE_ROUTES = "sg=ap-southeast-1/pet-reminder-sg, au=ap-southeast-2/pet-reminder-au"
+
+or as a table in secrets.toml::
+
+    [STORAGE_ROUTES]
+    sg = { region = "ap-southeast-1", bucket = "pet-reminder-sg" }
+
+A deployment serves its own ``MARKET``; a BundleSpec can name another one.
+Markets without a route use ``AWS_REGION`` / ``S3_BUCKET_NAME``. Routing only
+swaps the region and bucket of the config, so clients (one pooled client per
+region, see reminder_core.storage), readiness probes, counters and indexes all
+follow the route, and object URLs point at the routed bucket.
+"""
+from collections import namedtuple
+from collections.abc import Mapping
+
+StorageRoute = namedtuple('StorageRoute', ['market', 'region', 'bucket'])
+
+
+def _normalize_market(market):
+    return (market or '').strip().lower()
+
+
+def parse_storage_routes(value):
+    """{market: StorageRoute} from a route string or mapping, raising ValueError on bad entries"""
+    if not value:
+        return {}
+
+    if isinstance(value, Mapping):
+        entries = []
+        for market, target in value.items():
+            if isinstance(target, Mapping):
+                entries.append((market, target.get('region'), target.get('bucket')))
+            else:
+                entries.append((market, *str(target).partition('/')[::2]))
+    else:
+        entries = []
+        for entry in str(value).split(','):
+            if not entry.strip():
+                continue
+            market, _, target = entry.partition('=')
+            entries.append((market, *target.partition('/')[::2]))
+
+    routes = {}
+    for market, region, bucket in entries:
+        market = _normalize_market(market)
+        region = (region or '').strip()
+        bucket = (bucket or '').strip()
+        if not (market and region and bucket):
+            raise ValueError(f"Invalid storage route for market {market!r}; expected market=region/bucket")
+        routes[market] = StorageRoute(market, region, bucket)
+    return routes
+
+
+def resolve_route(config, market=None):
+    """Route for ``market`` (the deployment's market when omitted)
+
+    Raises ValueError for a market that has no route while routes are configured.
+    """
+    market = _normalize_market(market) or _normalize_market(config.market)
+    routes = parse_storage_routes(config.storage_routes)
+    if market in routes:
+        return routes[market]
+    if market and routes:
+        raise ValueError(f"No storage route for market {market!r}; expected one of {', '.join(routes)}")
+    return StorageRoute(market, config.region, config.bucket)
+
+
+def routed_config(config, market=None):
+    """``config`` with the region and bucket of the market's route"""
+    route = resolve_route(config, market)
+    return config._replace(region=route.region, bucket=route.bucket, market=route.market)
@@ -0,0 +1,105 @@
+"""Contention-free allocation of reminder sequence numbers
+
+Each process leases a block of numbers from the shared counter object with an
+ETag-guarded write, then hands them out from memory until the block runs
+out. Concurrent processes that race on the counter lose the conditional write
+and retry, so no number is ever handed out twice.
+"""
+import random
+import threading
+import time
+
+from reminder_core.backends import PreconditionFailed
+
+COUNTER_KEY = 'system/counter.txt'
+
+# Numbers leased per round trip; unused numbers are skipped on restart
+SEQUENCE_BLOCK_SIZE = 20
+
+# Attempts at winning the conditional write before giving up
+SEQUENCE_LEASE_ATTEMPTS = 20
+
+_allocators = {}
+_lock = threading.Lock()
+
+
+def get_sequence_allocator(backend):
+    """Return the process-wide allocator for a storage backend's counter"""
+    with _lock:
+        allocator = _allocators.get(backend)
+        if allocator is None:
+            allocator = SequenceAllocator(backend)
+            _allocators[backend] = allocator
+        return allocator
+
+
+def get_local_sequence_allocator():
+    """Return the process-wide allocator used when storage is not available"""
+    with _lock:
+        allocator = _allocators.get(None)
+        if allocator is None:
+            allocator = LocalSequenceAllocator()
+            _allocators[None] = allocator
+        return allocator
+
+
+class SequenceAllocator:
+    """Serve sequence numbers from blocks leased off the counter object in a StorageBackend
+
+    The counter object holds the highest number leased so far, so it stays
+    compatible with counters written by the old read-modify-write code.
+    """
+
+    def __init__(self, backend, key=COUNTER_KEY, block_size=SEQUENCE_BLOCK_SIZE,
+                 max_attempts=SEQUENCE_LEASE_ATTEMPTS):
+        self.backend = backend
+        self.key = key
+        self.block_size = block_size
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._next = 0
+        self._end = 0
+
+    def next(self):
+        """Return the next unused sequence number"""
+        with self._lock:
+            if self._next >= self._end:
+                self._next, self._end = self._lease()
+            number = self._next
+            self._next += 1
+            return number
+
+    def _lease(self):
+        """Reserve the next block on the counter and return its [start, end) range"""
+        for attempt in range(self.max_attempts):
+            counter = self.backend.get(self.key)
+            if counter is not None:
+                current = int(counter.body.decode('utf-8'))
+                condition = {'if_match': counter.etag}
+            else:
+                # First lease ever - only succeed if nobody created the counter meanwhile
+                current = 0
+                condition = {'if_none_match': True}
+
+            leased_to = current + self.block_size
+            try:
+                self.backend.put(self.key, str(leased_to).encode('utf-8'), 'text/plain', **condition)
+                return current + 1, leased_to + 1
+            except PreconditionFailed:
+                # Another process won the race - back off briefly and re-read
+                time.sleep(random.uniform(0, 0.01 * (attempt + 1)))
+
+        raise RuntimeError(f"Could not lease sequence numbers after {self.max_attempts} attempts")
+
+
+class LocalSequenceAllocator(SequenceAllocator):
+    """In-memory allocator shared by all sessions in the process"""
+
+    def __init__(self, block_size=SEQUENCE_BLOCK_SIZE):
+        super().__init__(backend=None, key=None, block_size=block_size)
+        self._leased_to = 0
+
+    def _lease(self):
+        start = self._leased_to + 1
+        self._leased_to += self.block_size
+        return start, self._leased_to + 1
@@ -0,0 +1,83 @@
+"""Publish shared page assets once under immutable, content-hashed keys
+
+Generated pages can link to the stylesheet, logos and icons instead of
+inlining them, so each page only carries per-reminder data and phones cache
+the shared files across every scanned reminder.
+"""
+import hashlib
+import os
+import threading
+from collections import namedtuple
+
+from reminder_core.backends import PreconditionFailed
+from reminder_core.uploads import UploadItem, upload_bundle
+
+STATIC_PREFIX = 'static/'
+
+# Keys change whenever content does, so objects can be cached forever
+STATIC_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# Either ``path`` (read from disk) or ``body`` (bytes) supplies the content
+StaticAsset = namedtuple('StaticAsset', ['name', 'filename', 'content_type', 'path', 'body'], defaults=(None, None))
+
+_manifests = {}
+_lock = threading.Lock()
+
+
+def content_hashed_key(filename, body):
+    """Immutable object key for a file's content, e.g. static/logo.3f2a...png"""
+    stem, ext = os.path.splitext(filename)
+    digest = hashlib.sha256(body).hexdigest()[:16]
+    return f"{STATIC_PREFIX}{stem}.{digest}{ext}"
+
+
+def _source_stamp(asset):
+    if asset.body is not None:
+        return hashlib.sha256(asset.body).hexdigest()
+    stat = os.stat(asset.path)
+    return (asset.path, stat.st_mtime_ns, stat.st_size)
+
+
+def publish_static_assets(backend, assets):
+    """Make sure every asset is published and return {name: url}
+
+    Each object is created at most once (IfNoneMatch) and the resulting
+    manifest is cached per process until an asset's content changes.
+    """
+    cache_key = (backend, tuple((a.name, _source_stamp(a)) for a in assets))
+    with _lock:
+        manifest = _manifests.get(cache_key)
+    if manifest is not None:
+        return manifest
+
+    items = []
+    for asset in assets:
+        body = asset.body
+        if body is None:
+            with open(asset.path, "rb") as f:
+                body = f.read()
+        items.append(UploadItem(
+            name=asset.name,
+            key=content_hashed_key(asset.filename, body),
+            body=body,
+            content_type=asset.content_type,
+            cache_control=STATIC_CACHE_CONTROL,
+            if_none_match=True
+        ))
+
+    results = upload_bundle(backend, items)
+    manifest = {}
+    for item in items:
+        result = results[item.name]
+        if result.ok or _already_published(result.error):
+            manifest[item.name] = backend.url(item.key)
+        else:
+            raise RuntimeError(f"Could not publish {item.key}: {result.error}")
+
+    with _lock:
+        _manifests[cache_key] = manifest
+    return manifest
+
+
+def _already_published(error):
+    return isinstance(error, PreconditionFailed)
@@ -0,0 +1,141 @@
+"""Process-wide S3 client and cached bucket readiness probe
+
+Streamlit re-executes the app script on every widget interaction, so anything
+created at the script's top level is rebuilt on each rerun. Objects kept in
+this module live in ``sys.modules`` and are created once per process.
+
+boto3 is only imported when the first client is built, which normally happens
+on the background readiness probe rather than on the first render.
+"""
+import threading
+import time
+from collections import namedtuple
+
+# Connections kept open per client; shared by every session in the process.
+# Size it to the PUTs in flight at once (uploads.UPLOAD_MAX_WORKERS plus probes)
+S3_MAX_POOL_CONNECTIONS = 20
+
+# Fail fast on an unreachable or stalled endpoint instead of botocore's 60 s each
+S3_CONNECT_TIMEOUT = 5
+S3_READ_TIMEOUT = 10
+
+# 'adaptive' also rate-limits the client when S3 starts throttling
+S3_RETRY_MODE = 'adaptive'
+S3_MAX_ATTEMPTS = 3  # including the first try
+
+S3Transport = namedtuple(
+    'S3Transport',
+    ['max_pool_connections', 'connect_timeout', 'read_timeout', 'retry_mode', 'max_attempts'],
+    defaults=(S3_MAX_POOL_CONNECTIONS, S3_CONNECT_TIMEOUT, S3_READ_TIMEOUT, S3_RETRY_MODE, S3_MAX_ATTEMPTS)
+)
+
+DEFAULT_S3_TRANSPORT = S3Transport()
+
+# How long a readiness probe result is trusted before it is refreshed
+AWS_READINESS_TTL = 300
+
+# How long the submit path waits for the very first probe to finish
+AWS_READINESS_WAIT = 10
+
+_clients = {}
+_readiness = {}
+_lock = threading.Lock()
+
+
+def get_s3_client(region, aws_access_key_id=None, aws_secret_access_key=None, transport=DEFAULT_S3_TRANSPORT):
+    """Return the shared S3 client for these credentials and transport settings, creating it once"""
+    key = (region, aws_access_key_id, aws_secret_access_key, transport)
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            import boto3
+            from botocore.config import Config
+
+            client = boto3.client(
+                's3',
+                region_name=region,
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                config=Config(
+                    max_pool_connections=transport.max_pool_connections,
+                    connect_timeout=transport.connect_timeout,
+                    read_timeout=transport.read_timeout,
+                    retries={'mode': transport.retry_mode, 'total_max_attempts': transport.max_attempts}
+                )
+            )
+            _clients[key] = client
+        return client
+
+
+def get_s3_readiness(bucket, region, aws_access_key_id=None, aws_secret_access_key=None,
+                     transport=DEFAULT_S3_TRANSPORT):
+    """Return the shared readiness probe for a bucket; its client is created on first use"""
+    key = (bucket, region, aws_access_key_id, aws_secret_access_key, transport)
+    with _lock:
+        readiness = _readiness.get(key)
+        if readiness is None:
+            readiness = S3Readiness(
+                lambda: get_s3_client(region, aws_access_key_id, aws_secret_access_key, transport), bucket
+            )
+            _readiness[key] = readiness
+        return readiness
+
+
+class S3Readiness:
+    """Probe a bucket in the background and cache whether S3 is usable
+
+    Reruns only ever read the cached state; an expired or missing result
+    starts a new probe on a daemon thread instead of blocking the caller.
+    """
+
+    def __init__(self, client_factory, bucket, ttl=AWS_READINESS_TTL):
+        self.client_factory = client_factory
+        self.bucket = bucket
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._first_probe = threading.Event()
+        self._probing = False
+        self._checked_at = None
+        self._configured = False
+        self._error = None
+
+    def refresh(self):
+        """Start a background probe if the cached state is missing or stale"""
+        with self._lock:
+            if self._probing:
+                return
+            if self._checked_at is not None and time.monotonic() - self._checked_at < self.ttl:
+                return
+            self._probing = True
+        threading.Thread(target=self._probe, name="s3-readiness", daemon=True).start()
+
+    @property
+    def client(self):
+        """The shared S3 client, built (and boto3 imported) on first access"""
+        return self.client_factory()
+
+    def _probe(self):
+        try:
+            self.client.head_bucket(Bucket=self.bucket)
+            configured, error = True, None
+        except Exception as e:
+            configured, error = False, e
+
+        with self._lock:
+            self._configured = configured
+            self._error = error
+            self._checked_at = time.monotonic()
+            self._probing = False
+        self._first_probe.set()
+
+    def is_configured(self, wait=0):
+        """Return the cached readiness, waiting up to ``wait`` seconds for the first probe"""
+        self.refresh()
+        if wait:
+            self._first_probe.wait(wait)
+        return self._configured
+
+    @property
+    def error(self):
+        """Exception raised by the most recent failed probe, if any"""
+        return self._error
@@ -0,0 +1,47 @@
+"""Minimal precompiled HTML templates with named, auto-escaped slots
+
+A template is parsed once into alternating literal chunks and slot names.
+Rendering is a single ``''.join`` over those pieces, with user values
+HTML-escaped on the way in unless the slot is marked ``|raw``:
+
+    <div class="pet-name">{{ pet_name }}</div>
+    {{ notes_section|raw }}
+"""
+import html
+import re
+
+_SLOT = re.compile(r'\{\{\s*(\w+)(\|raw)?\s*\}\}')
+
+
+class CompiledTemplate:
+    """Template split into literal text and named slots at construction time"""
+
+    def __init__(self, source):
+        self.literals = []
+        self.slots = []
+        position = 0
+        for match in _SLOT.finditer(source):
+            self.literals.append(source[position:match.start()])
+            self.slots.append((match.group(1), bool(match.group(2))))
+            position = match.end()
+        self.literals.append(source[position:])
+        self.names = frozenset(name for name, _ in self.slots)
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls(f.read())
+
+    def render(self, **values):
+        """Fill every slot; escaped slots go through html.escape"""
+        missing = self.names - values.keys()
+        if missing:
+            raise KeyError(f"Missing template values: {', '.join(sorted(missing))}")
+
+        literals = self.literals
+        parts = [literals[0]]
+        for index, (name, raw) in enumerate(self.slots, start=1):
+            value = values[name]
+            parts.append(str(value) if raw else html.escape(str(value)))
+            parts.append(literals[index])
+        return ''.join(parts)
@@ -0,0 +1,65 @@
+"""Concurrent upload of a reminder's artifacts to the storage backend
+
+All PUTs of a bundle are issued together over a bounded, process-wide thread
+pool, so a submit waits roughly as long as its slowest object instead of the
+sum of all of them.
+"""
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# Concurrent PUTs across all sessions in the process; keep at or below the
+# client's connection pool size so uploads never queue for a connection
+UPLOAD_MAX_WORKERS = 8
+
+UploadItem = namedtuple(
+    'UploadItem',
+    ['name', 'key', 'body', 'content_type', 'content_disposition', 'cache_control', 'if_none_match'],
+    defaults=(None, None, False)
+)
+
+
+class UploadResult(namedtuple('UploadResult', ['name', 'key', 'url', 'error'])):
+    """Outcome of one object in a bundle; ``url`` is None when it failed"""
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+_executor = None
+_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=UPLOAD_MAX_WORKERS, thread_name_prefix="s3-upload")
+        return _executor
+
+
+def _put(backend, item):
+    try:
+        # if_none_match only creates the object; an existing one fails with PreconditionFailed
+        backend.put(
+            item.key, item.body, item.content_type,
+            cache_control=item.cache_control,
+            content_disposition=item.content_disposition,
+            if_none_match=item.if_none_match
+        )
+        return UploadResult(item.name, item.key, backend.url(item.key), None)
+    except Exception as e:
+        return UploadResult(item.name, item.key, None, e)
+
+
+def upload_bundle(backend, items, executor=None):
+    """Upload all items concurrently to a StorageBackend and return {name: UploadResult}
+
+    Failures are reported per object and never cancel the other uploads.
+    Background work passes its own ``executor`` so it never queues ahead of submits.
+    """
+    executor = executor or _get_executor()
+    futures = [executor.submit(_put, backend, item) for item in items]
+    results = (future.result() for future in futures)
+    return {result.name: result for result in results}
@@ -0,0 +1,150 @@
+"""The per-reminder web page that serves the calendar file
+
+The page markup (web_page.html) and stylesheet (web_page.css) are loaded and
+compiled once at import; each page build only fills the template's slots.
+"""
+import base64
+import os
+
+from reminder_core.assets import asset_cache
+from reminder_core.static_assets import StaticAsset
+from reminder_core.templates import CompiledTemplate
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Stylesheet of the generated web page - inlined by default, or published once as a shared static asset
+with open(os.path.join(_HERE, 'web_page.css'), encoding='utf-8') as _f:
+    WEB_PAGE_CSS = _f.read()
+
+WEB_PAGE_TEMPLATE = CompiledTemplate.from_file(os.path.join(_HERE, 'web_page.html'))
+
+TIMES_SECTION_TEMPLATE = CompiledTemplate('''<div class="times-section">
+                <div class="times-title">Reminder Time:</div>
+                <div class="times-list">
+                    {{ times }}
+                </div>
+            </div>
+            ''')
+
+NOTES_SECTION_TEMPLATE = CompiledTemplate('''
+            <div class="notes-section">
+                <div class="notes-title">Additional Notes:</div>
+                <div class="notes-text">{{ notes }}</div>
+            </div>
+            ''')
+
+INLINE_STYLE_HTML = f"<style>\n{WEB_PAGE_CSS}    </style>"
+
+# Assets shared by every generated web page
+WEB_PAGE_LOGO_PATH = "./assets/logos/Boehringer_Logo_RGB_Black.png"
+WEB_PAGE_FAVICON_PATH = "./assets/icons/FAV_Icon_chew_CMYK_RSG.png"
+WEB_PAGE_CALENDAR_ICON_PATH = "./assets/icons/calendar_white_resized.png"
+WEB_PAGE_BACK_ICON_PATH = "./assets/icons/left_nexgard_arrow_blue.png"
+
+
+def web_page_static_assets():
+    """Shared assets a generated web page can reference instead of inlining"""
+    return [
+        StaticAsset('stylesheet', 'reminder_page.css', 'text/css', body=WEB_PAGE_CSS.encode('utf-8')),
+        StaticAsset('logo', os.path.basename(WEB_PAGE_LOGO_PATH), 'image/png', path=WEB_PAGE_LOGO_PATH),
+        StaticAsset('favicon', os.path.basename(WEB_PAGE_FAVICON_PATH), 'image/png', path=WEB_PAGE_FAVICON_PATH),
+        StaticAsset('calendar_icon', os.path.basename(WEB_PAGE_CALENDAR_ICON_PATH), 'image/png', path=WEB_PAGE_CALENDAR_ICON_PATH),
+        StaticAsset('back_icon', os.path.basename(WEB_PAGE_BACK_ICON_PATH), 'image/png', path=WEB_PAGE_BACK_ICON_PATH),
+    ]
+
+
+def get_html_icon(icon_path, alt_text, size="medium", src=None):
+    """Helper function to get base64 encoded icon for HTML
+
+    Args:
+        icon_path: Path to the PNG icon file
+        alt_text: Alternative text for accessibility
+        size: Icon size - "small" (16px), "medium" (22px), "large" (28px), "xlarge" (40px), or custom "XYpx"
+        src: Optional URL of the hosted icon, used instead of inlining the file
+    """
+    # Define size mappings to match font sizes in your CSS
+    size_map = {
+        "small": "18px",      # For Body2 font (16px)
+        "medium": "28px",     # For Hero Body font (22px)
+        "large": "36px",      # For Superhead1/Body1 font (18px) but larger for visibility
+        "xlarge": "48px",
+        "button": "32px",     # For H1/large headings
+        "title": "60px"       # For pet name title size
+    }
+
+    # Handle custom size (e.g., "28px") or use predefined sizes
+    if size.endswith("px"):
+        icon_size = size
+    else:
+        icon_size = size_map.get(size, "22px")
+
+    style = f"width:{icon_size};height:{icon_size};vertical-align:middle;"
+    if src:
+        return f'<img src="{src}" alt="{alt_text}" style="{style}">'
+
+    # Served from the process-wide asset cache - no disk read or base64 encoding once warm
+    icon_html = asset_cache.img_tag(icon_path, alt_text, style)
+    if icon_html:
+        return icon_html
+    # Fallback emojis
+    fallback_emojis = {
+        "clock": "⏰",
+        "calendar": "📅",
+        "mobile": "📱",
+        "notes": "📝",
+        "back": "🔙",
+        "pet": "🐾"
+    }
+    return fallback_emojis.get(alt_text, "📝")
+
+
+def create_web_page_html(pet_name, product_name, calendar_url, reminder_details, qr_image_bytes, static_urls=None):
+    """Create HTML page that serves calendar with device detection
+
+    Args:
+        static_urls: Optional {name: url} of published shared assets (see web_page_static_assets);
+            when given the page links to them instead of inlining the CSS, logo and icons
+    """
+    if static_urls:
+        logo_url = static_urls['logo']
+        favicon_url = static_urls['favicon']
+        style_html = f'<link rel="stylesheet" href="{static_urls["stylesheet"]}">'
+    else:
+        # Base64 data URLs for the web page specific logo and favicon (cached per process)
+        logo_url = asset_cache.data_url(WEB_PAGE_LOGO_PATH) or WEB_PAGE_LOGO_PATH
+        favicon_url = asset_cache.data_url(WEB_PAGE_FAVICON_PATH) or WEB_PAGE_FAVICON_PATH
+        style_html = INLINE_STYLE_HTML
+    static_urls = static_urls or {}
+
+    # Get icon HTML strings - Calendar icon made larger to match visual weight of back icon
+    calendar_icon = get_html_icon(WEB_PAGE_CALENDAR_ICON_PATH, "calendar", "button", src=static_urls.get('calendar_icon'))
+    back_icon = get_html_icon(WEB_PAGE_BACK_ICON_PATH, "back", "button", src=static_urls.get('back_icon'))
+
+    # Optional sections are rendered from their own templates so user input is escaped there too
+    times_section = ""
+    if reminder_details['times'] != '':
+        times_section = TIMES_SECTION_TEMPLATE.render(times=f"• {reminder_details['times']}")
+
+    notes_section = ""
+    if reminder_details.get('notes') and reminder_details['notes'].strip():
+        notes_section = NOTES_SECTION_TEMPLATE.render(notes=reminder_details['notes'])
+
+    # favicon_url, logo_url and qr_src are raw slots: they are generated here (data URLs or
+    # published asset URLs), and escaping ~100 KB of base64 would cost more than the render
+    return WEB_PAGE_TEMPLATE.render(
+        pet_name=pet_name.upper(),
+        favicon_url=favicon_url,
+        style_html=style_html,
+        logo_url=logo_url,
+        frequency=reminder_details['frequency'],
+        start_date=reminder_details['start_date'],
+        duration=reminder_details['duration'],
+        total_reminders=reminder_details['total_reminders'],
+        times_section=times_section,
+        notes_section=notes_section,
+        calendar_url=calendar_url,
+        download_name=f"{pet_name.upper()}_{product_name}_reminder.ics",
+        calendar_icon=calendar_icon,
+        back_icon=back_icon,
+        qr_src=f"data:image/png;base64,{base64.b64encode(qr_image_bytes).decode()}"
+    )